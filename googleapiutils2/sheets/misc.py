@@ -30,6 +30,12 @@ DUPE_SUFFIX = '__dupe__'
 
 DEFAULT_CHUNK_SIZE_BYTES = 1 * 1024 * 1024  # 1MB default chunk size
 
+DEFAULT_BATCH_SIZE_BYTES = 8 * 1024 * 1024  # 8MB, below the ~10MB request limit
+
+VALUES_CELL_OVERHEAD = 3  # estimated JSON punctuation per cell: quotes and a comma
+
+WRITE_REQUESTS_PER_MINUTE = 60  # per-user write quota
+
 
 SheetsValues = (
     list[list[Any]] | list[dict[str | Hashable | Any, Any]] | list[dict] | list[object]
@@ -378,7 +384,7 @@ def parse_sheet_slice_ixs(
     )
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class SheetSliceT:
     """For better indexing of a Sheet-like object, e.g. a Google Sheet.
     Allows you to index into a sheet using numpy-like syntax.
@@ -422,6 +428,8 @@ class SheetSliceT:
     shape: SheetShape = INIT_SHEET_SHAPE
 
     slices: tuple[slice, slice] = field(init=False, repr=False, hash=False)
+    # the A1 string is built once, as slices are stringified on every request
+    range_str: str = field(init=False, repr=False, hash=False, compare=False)
 
     def __post_init__(self) -> None:
         self.slices = (
@@ -432,6 +440,7 @@ class SheetSliceT:
                 slice(1, self.shape[1]),
             )
         )
+        self.range_str = format_range_name(self.sheet_name, self.range_name)
 
     @property
     def rows(self) -> slice:
@@ -447,7 +456,7 @@ class SheetSliceT:
         )
 
     def __repr__(self) -> str:
-        return format_range_name(self.sheet_name, self.range_name)
+        return self.range_str
 
     def __getitem__(
         self, ixs: str | tuple[Any, ...] | SheetSliceT | Any
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
 import atexit
+import copy
 import itertools
+import json
 import operator
+import threading
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, DefaultDict, Generator, Hashable, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Generator,
+    Hashable,
+    Iterable,
+    List,
+)
 
 import pandas as pd
 from cachetools import cachedmethod
 from google.oauth2.credentials import Credentials
 from googleapiclient import discovery
+from googleapiclient.errors import HttpError
 
 from googleapiutils2.sheets.sheets_slice import (
     SheetSlice,
@@ -22,20 +38,24 @@ from ..utils import (
     EXECUTE_TIME,
     THROTTLE_TIME,
     DriveBase,
+    FastJsonModel,
     ServiceAccountCredentials,
     Throttler,
+    TokenBucket,
     deep_update,
     hex_to_rgb,
     named_methodkey,
-    nested_defaultdict,
     parse_file_id,
 )
 from .misc import (
+    DEFAULT_BATCH_SIZE_BYTES,
     DEFAULT_CHUNK_SIZE_BYTES,
     DEFAULT_SHEET_NAME,
     DEFAULT_SHEET_SHAPE,
     DUPE_SUFFIX,
+    VALUES_CELL_OVERHEAD,
     VERSION,
+    WRITE_REQUESTS_PER_MINUTE,
     HorizontalAlignment,
     HyperlinkDisplayType,
     InsertDataOption,
@@ -47,6 +67,7 @@ from .misc import (
     ValueRenderOption,
     VerticalAlignment,
     WrapStrategy,
+    normalize_sheet_name,
 )
 
 if TYPE_CHECKING:
@@ -81,6 +102,58 @@ if TYPE_CHECKING:
 
 pd.set_option('future.no_silent_downcasting', True)
 
+MAX_FLUSH_WORKERS = 8
+
+# batch update request kinds which only touch cells, leaving a sheet's properties intact
+CELL_REQUEST_KINDS = frozenset(
+    {
+        "repeatCell",
+        "updateCells",
+        "updateBorders",
+        "mergeCells",
+        "unmergeCells",
+        "updateDimensionProperties",
+        "autoResizeDimensions",
+    }
+)
+
+
+def _to_color(color: Color | str) -> Color:
+    return hex_to_rgb(color) if isinstance(color, str) else color
+
+
+def _to_padding(padding: Padding | int) -> Padding:
+    if isinstance(padding, int):
+        return {"top": padding, "bottom": padding, "left": padding, "right": padding}
+    return padding if isinstance(padding, dict) else {}
+
+
+def _to_enum_value(value: Any) -> Any:
+    return value.value
+
+
+# (argument name, API field name, converter) specs for `_create_cell_format`
+TEXT_FORMAT_FIELDS: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("bold", "bold", None),
+    ("italic", "italic", None),
+    ("underline", "underline", None),
+    ("strikethrough", "strikethrough", None),
+    ("font_size", "fontSize", None),
+    ("font_family", "fontFamily", None),
+    ("text_color", "foregroundColor", _to_color),
+)
+
+CELL_FORMAT_FIELDS: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("background_color", "backgroundColor", _to_color),
+    ("padding", "padding", _to_padding),
+    ("horizontal_alignment", "horizontalAlignment", _to_enum_value),
+    ("vertical_alignment", "verticalAlignment", _to_enum_value),
+    ("wrap_strategy", "wrapStrategy", _to_enum_value),
+    ("text_direction", "textDirection", _to_enum_value),
+    ("hyperlink_display_type", "hyperlinkDisplayType", _to_enum_value),
+    ("number_format", "numberFormat", None),
+)
+
 
 class Sheets(DriveBase):
     """A wrapper around the Google Sheets API.
@@ -103,20 +176,51 @@ class Sheets(DriveBase):
             creds=creds, execute_time=execute_time, throttle_time=throttle_time
         )
 
-        self.service: SheetsResource = discovery.build(  # type: ignore
-            "sheets", VERSION, credentials=self.creds
+        self._batched_data: DefaultDict[str, dict[str, SheetsValues]] = defaultdict(
+            dict
         )
-        self.spreadsheets: SheetsResource.SpreadsheetsResource = (
-            self.service.spreadsheets()
+        self._batched_bytes: DefaultDict[str, int] = defaultdict(int)
+        # guards the batched data, which may be written and flushed from several threads
+        self._batched_lock = threading.Lock()
+
+        self._batch_update_throttler = Throttler(throttle_time)
+        # stay within the write quota, rather than exceeding it and backing off
+        self._write_limiter = TokenBucket(
+            rate=WRITE_REQUESTS_PER_MINUTE / 60, burst=WRITE_REQUESTS_PER_MINUTE
         )
 
-        self._batched_data: DefaultDict[str, dict[str | Any, SheetsValues]] = (
-            defaultdict(dict)
+        # requests queued by `batched` are per thread, so other threads' calls aren't queued
+        self._batched_local = threading.local()
+
+        # the exit flush is registered once data is first batched
+        self._atexit_registered = False
+
+    @cached_property
+    def service(self) -> SheetsResource:
+        """The Sheets API service; built on first use, as building it loads the discovery document."""
+        return discovery.build(  # type: ignore
+            "sheets", VERSION, credentials=self.creds, model=FastJsonModel()
         )
 
-        self._batch_update_throttler = Throttler(throttle_time)
+    @cached_property
+    def spreadsheets(self) -> SheetsResource.SpreadsheetsResource:
+        return self.service.spreadsheets()
+
+    def close(self) -> None:
+        """Flushes any remaining batched data, then shuts down the asynchronous worker pool."""
+        try:
+            self.batch_update_remaining_auto()
+        finally:
+            super().close()
+
+    @property
+    def _pending_requests(self) -> DefaultDict[str, list[Request]] | None:
+        """The requests queued by `batched` on this thread, per spreadsheet; None when not batching."""
+        return getattr(self._batched_local, "pending_requests", None)
 
-        atexit.register(self.batch_update_remaining_auto)
+    @_pending_requests.setter
+    def _pending_requests(self, value: DefaultDict[str, list[Request]] | None):
+        self._batched_local.pending_requests = value
 
     def _reset_sheet_cache(
         self,
@@ -129,8 +233,8 @@ class Sheets(DriveBase):
 
         key = (cache_key, spreadsheet_id, name)
 
-        if key in self._cache:
-            self._cache.pop(key)
+        with self._cache_lock:
+            self._cache.pop(key, None)
 
         return sheet_id
 
@@ -146,10 +250,62 @@ class Sheets(DriveBase):
 
         key = (cache_key, spreadsheet_id, name)
 
-        self._cache[key] = value
+        with self._cache_lock:
+            self._cache[key] = value
 
         return sheet_id
 
+    def _reset_spreadsheet_cache(self, cache_key: str, spreadsheet_id: str):
+        """Drops every `cache_key` entry belonging to a spreadsheet, regardless of sheet."""
+        with self._cache_lock:
+            for key in list(self._cache.keys()):
+                if key[:2] == (cache_key, spreadsheet_id):
+                    self._cache.pop(key, None)
+
+    def _reset_sheet_caches(self, spreadsheet_id: str, sheet_ids: Iterable[int]):
+        """Drops every cached entry belonging to the given sheets, under any spelling of their names.
+        Used once a sheet's name is no longer valid, i.e. after it's been renamed or deleted."""
+        sheet_ids = set(sheet_ids)
+
+        with self._cache_lock:
+            # the sheets' titles, as known to the ID caches
+            titles = {
+                self._sheet_title(key[2])
+                for key, value in list(self._cache.items())
+                if key[0] in ("id", "sheet_id")
+                and key[1] == spreadsheet_id
+                and value in sheet_ids
+            }
+
+            for key in list(self._cache.keys()):
+                if (
+                    key[1] == spreadsheet_id
+                    and len(key) > 2
+                    and isinstance(key[2], str)
+                    and self._sheet_title(key[2]) in titles
+                ):
+                    self._cache.pop(key, None)
+
+    @staticmethod
+    def _updates_sheet_shape(body: BatchUpdateSpreadsheetRequest) -> bool:
+        """Whether any request within a batch update body changes a sheet's row or column count."""
+        for request in body.get("requests", []):
+            if any(
+                key in request
+                for key in ("appendDimension", "insertDimension", "deleteDimension")
+            ):
+                return True
+
+            fields = request.get("updateSheetProperties", {}).get("fields", "")
+            if (
+                "rowCount" in fields
+                or "columnCount" in fields
+                or fields in ("*", "gridProperties")
+            ):
+                return True
+
+        return False
+
     def batch_update_spreadsheet(
         self,
         spreadsheet_id: str,
@@ -167,7 +323,76 @@ class Sheets(DriveBase):
         request = self.spreadsheets.batchUpdate(
             spreadsheetId=spreadsheet_id, body=body, **kwargs
         )
-        return self.execute(request)  # type: ignore
+        response = self.execute(request)
+
+        # cached sheet metadata is stale unless only cells were updated; cached shapes once the grid
+        # has been resized
+        if not all(
+            request.keys() <= CELL_REQUEST_KINDS for request in body.get("requests", [])
+        ):
+            for cache_key in ("sheet", "spreadsheet"):
+                self._reset_spreadsheet_cache(
+                    cache_key=cache_key, spreadsheet_id=spreadsheet_id
+                )
+
+        if self._updates_sheet_shape(body):
+            self._reset_spreadsheet_cache(
+                cache_key="shape", spreadsheet_id=spreadsheet_id
+            )
+
+        return response  # type: ignore
+
+    def _queue_batch_update_spreadsheet(
+        self,
+        spreadsheet_id: str,
+        body: BatchUpdateSpreadsheetRequest,
+    ) -> BatchUpdateSpreadsheetResponse | None:
+        """Queues the body's requests if within `batched`, otherwise executes them immediately."""
+        if self._pending_requests is None:
+            return self.batch_update_spreadsheet(spreadsheet_id=spreadsheet_id, body=body)
+
+        self._pending_requests[spreadsheet_id].extend(body.get("requests", []))
+
+        return None
+
+    @contextmanager
+    def batched(self) -> Generator[Sheets, None, None]:
+        """Queues the formatting and resizing requests made within the block, sending them
+        as one batch update per spreadsheet on exit.
+
+        Applies to `format`, `format_header(s)`, `resize`, `resize_dimensions`, `clear_formatting`,
+        and `freeze`; these return None while queued. Value writes and structural changes
+        (e.g. `add`, `delete`, `rename`, `reset_sheet`) are still made immediately, and so land before
+        any queued request; a queued `resize` hasn't grown the grid for the writes within the block.
+        If the block raises, the queued requests are discarded.
+
+        Only calls made on the entering thread are queued; other threads' calls run as usual.
+
+        Example:
+            >>> with sheets.batched():
+            >>>     for range_name in range_names:
+            >>>         sheets.format(SHEET_ID, range_name, bold=True)
+        """
+        # nested blocks are flushed by the outermost
+        if self._pending_requests is not None:
+            yield self
+            return
+
+        self._pending_requests = defaultdict(list)
+        try:
+            yield self
+        except BaseException:
+            self._pending_requests = None
+            raise
+
+        pending_requests, self._pending_requests = self._pending_requests, None
+
+        for spreadsheet_id, requests in pending_requests.items():
+            if not len(requests):
+                continue
+
+            body: BatchUpdateSpreadsheetRequest = {"requests": requests}
+            self.batch_update_spreadsheet(spreadsheet_id=spreadsheet_id, body=body)
 
     def create(
         self,
@@ -175,14 +400,42 @@ class Sheets(DriveBase):
         sheet_names: list[str] | None = None,
         body: Spreadsheet | None = None,  # type: ignore
     ) -> Spreadsheet:
-        body: Spreadsheet = nested_defaultdict(body if body else {})  # type: ignore
-        sheet_names = sheet_names if sheet_names is not None else [DEFAULT_SHEET_NAME]
+        # the default is a range's sheet name, quoted; titles are not
+        sheet_names = (
+            sheet_names
+            if sheet_names is not None
+            else [self._sheet_title(DEFAULT_SHEET_NAME)]
+        )
+
+        if not body:
+            body = {
+                "properties": {"title": title},
+                "sheets": [
+                    {"properties": {"title": sheet_name}} for sheet_name in sheet_names
+                ],
+            }
+            return self.execute(self.spreadsheets.create(body=body))  # type: ignore
+
+        # merge the titles into a shallow copy of the body, leaving the caller's as-is
+        body = {
+            **body,
+            "properties": {**body.get("properties", {}), "title": title},
+        }  # type: ignore
 
-        body["properties"]["title"] = title  # type: ignore
+        sheets = list(body.get("sheets") or [])
         for n, sheet_name in enumerate(sheet_names):
-            body["sheets"][n]["properties"]["title"] = sheet_name  # type: ignore
+            sheet = sheets[n] if n < len(sheets) else {}
+            sheet = {
+                **sheet,
+                "properties": {**sheet.get("properties", {}), "title": sheet_name},
+            }  # type: ignore
+
+            if n < len(sheets):
+                sheets[n] = sheet
+            else:
+                sheets.append(sheet)
 
-        body["sheets"] = list(body["sheets"].values())  # type: ignore
+        body["sheets"] = sheets  # type: ignore
 
         return self.execute(self.spreadsheets.create(body=body))  # type: ignore
 
@@ -223,7 +476,11 @@ class Sheets(DriveBase):
             )
         )
 
-    @cachedmethod(operator.attrgetter("_cache"), key=named_methodkey("header"))
+    @cachedmethod(
+        operator.attrgetter("_cache"),
+        key=named_methodkey("header"),
+        lock=operator.attrgetter("_cache_lock"),
+    )
     def header(self, spreadsheet_id: str, sheet_name: str = DEFAULT_SHEET_NAME):
         spreadsheet_id = parse_file_id(spreadsheet_id)
         range_name = str(SheetSlice[sheet_name, 1, ...])
@@ -231,22 +488,83 @@ class Sheets(DriveBase):
             "values", [[]]
         )[0]
 
-    @cachedmethod(operator.attrgetter("_cache"), key=named_methodkey("shape"))
+    def _prefetch_headers(self, spreadsheet_id: str, sheet_names: Iterable[str]):
+        """Warms the header cache of every given sheet with a single values.batchGet request,
+        rather than a request per sheet on first use."""
+        with self._cache_lock:
+            sheet_names = [
+                sheet_name
+                for sheet_name in dict.fromkeys(sheet_names)
+                if ("header", spreadsheet_id, sheet_name) not in self._cache
+            ]
+
+        # a single header is fetched as well by `header` itself
+        if len(sheet_names) < 2:
+            return
+
+        try:
+            response = self.execute(
+                self.spreadsheets.values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=[
+                        str(SheetSlice[sheet_name, 1, ...]) for sheet_name in sheet_names
+                    ],
+                    valueRenderOption=ValueRenderOption.unformatted.value,
+                )
+            )
+        except HttpError:
+            # e.g. one of the sheets doesn't exist; each header is then fetched on its own
+            return
+        value_ranges = response.get("valueRanges", [])  # type: ignore
+
+        with self._cache_lock:
+            for sheet_name, value_range in zip(sheet_names, value_ranges):
+                self._cache[("header", spreadsheet_id, sheet_name)] = value_range.get(
+                    "values", [[]]
+                )[0]
+
+    @cachedmethod(
+        operator.attrgetter("_cache"),
+        key=named_methodkey("shape"),
+        lock=operator.attrgetter("_cache_lock"),
+    )
     def shape(self, spreadsheet_id: str, sheet_name: str = DEFAULT_SHEET_NAME):
         spreadsheet_id = parse_file_id(spreadsheet_id)
-        properties = self.get(spreadsheet_id=spreadsheet_id, name=sheet_name)[
-            "properties"
-        ]
+        properties = self._get_sheet(spreadsheet_id, sheet_name)["properties"]
         shape = (
             properties["gridProperties"]["rowCount"],
             properties["gridProperties"]["columnCount"],
         )
         return shape
 
-    @cachedmethod(operator.attrgetter("_cache"), key=named_methodkey("id"))
+    @cachedmethod(
+        operator.attrgetter("_cache"),
+        key=named_methodkey("sheet"),
+        lock=operator.attrgetter("_cache_lock"),
+    )
+    def _get_sheet(
+        self, spreadsheet_id: str, sheet_name: str = DEFAULT_SHEET_NAME
+    ) -> Sheet:
+        """Cached sheet metadata (properties only); invalidated by any batch update to its spreadsheet."""
+        spreadsheet = self.get_spreadsheet(
+            spreadsheet_id, fields="sheets.properties", cache=True
+        )
+        title = self._sheet_title(sheet_name)
+
+        for sheet in spreadsheet["sheets"]:
+            if sheet["properties"]["title"] == title:
+                return sheet
+
+        raise ValueError(f"Sheet {sheet_name} not found in spreadsheet.")
+
+    @cachedmethod(
+        operator.attrgetter("_cache"),
+        key=named_methodkey("id"),
+        lock=operator.attrgetter("_cache_lock"),
+    )
     def id(self, spreadsheet_id: str, sheet_name: str = DEFAULT_SHEET_NAME) -> int:
-        sheet = self.get(spreadsheet_id=spreadsheet_id, name=sheet_name)
-        return sheet["properties"]["sheetId"]
+        spreadsheet_id = parse_file_id(spreadsheet_id)
+        return self._get_sheet_id(spreadsheet_id, name=sheet_name)
 
     def create_range_url(self, file_id: str, sheet_slice: SheetSliceT) -> str:
         file_id = parse_file_id(file_id)
@@ -262,21 +580,57 @@ class Sheets(DriveBase):
         spreadsheet_id: str,
         include_grid_data: bool = False,
         ranges: SheetsRange | list[SheetsRange] | None = None,
+        fields: str | None = None,
+        cache: bool = False,
+        refresh: bool = False,
     ) -> Spreadsheet:
+        """Get a spreadsheet's metadata, and optionally its grid data.
+
+        If `cache` is set, metadata-only responses (no grid data nor ranges) are cached per field mask,
+        until a batch update changes the spreadsheet's sheets or the entry expires.
+        Each caller gets its own copy of a cached response.
+
+        Args:
+            spreadsheet_id (str): The ID of the spreadsheet to get.
+            include_grid_data (bool, optional): Whether to include the grid data. Defaults to False.
+            ranges (SheetsRange | list[SheetsRange], optional): The ranges to get grid data from. Defaults to None.
+            fields (str, optional): A field mask for the response. Defaults to None.
+            cache (bool, optional): Whether to use, and update, the cached response. Defaults to False.
+            refresh (bool, optional): Whether to bypass the cached response and refetch; the new
+                response is still cached. Defaults to False.
+        """
         spreadsheet_id = parse_file_id(spreadsheet_id)
 
         ranges = ranges if ranges is not None else []
         ranges = ranges if isinstance(ranges, list) else [ranges]
         ranges = [str(range_name) for range_name in ranges]
 
+        cacheable = cache and not include_grid_data and not len(ranges)
+        key = ("spreadsheet", spreadsheet_id, fields)
+
+        if cacheable and not refresh:
+            with self._cache_lock:
+                if (spreadsheet := self._cache.get(key)) is not None:
+                    return copy.deepcopy(spreadsheet)
+
         kwargs = {
             "spreadsheetId": spreadsheet_id,
             "includeGridData": include_grid_data,
         }
         if len(ranges) > 0:
             kwargs["ranges"] = ranges
+        if fields is not None:
+            kwargs["fields"] = fields
+
+        spreadsheet = self.execute(self.spreadsheets.get(**kwargs))
+
+        if cacheable:
+            with self._cache_lock:
+                self._cache[key] = spreadsheet
+
+            return copy.deepcopy(spreadsheet)  # type: ignore
 
-        return self.execute(self.spreadsheets.get(**kwargs))  # type: ignore
+        return spreadsheet  # type: ignore
 
     def _get_sheet_id(
         self, spreadsheet_id: str, name: str | None = None, sheet_id: int | None = None
@@ -296,32 +650,75 @@ class Sheets(DriveBase):
             raise ValueError("Either the name or the ID of the sheet must be provided.")
 
         def inner():
-            t_name = (
-                name.strip("'") if name.startswith("'") and name.endswith("'") else name
-            )
-            spreadsheet = self.get_spreadsheet(spreadsheet_id)
-
-            for sheet in spreadsheet["sheets"]:
-                properties = sheet["properties"]
-                if properties["title"] == t_name:
-                    return properties["sheetId"]
+            # resolves, and caches, the IDs of every sheet in the spreadsheet at once
+            return self._get_sheet_ids(spreadsheet_id).get(self._sheet_title(name))
 
-        key = ("sheet_id", spreadsheet_id, name)
+        # keyed by title, so that quoted and unquoted names share an entry
+        key = ("sheet_id", spreadsheet_id, self._sheet_title(name))
 
-        try:
-            return self._cache[key]
-        except KeyError:
-            pass
+        with self._cache_lock:
+            try:
+                return self._cache[key]
+            except KeyError:
+                pass
 
         sheet_id = inner()
 
         if sheet_id is None:
             raise ValueError(f"Sheet {name} not found in spreadsheet.")
 
-        self._cache[key] = sheet_id
+        with self._cache_lock:
+            self._cache[key] = sheet_id
 
         return sheet_id
 
+    @staticmethod
+    def _sheet_title(name: str) -> str:
+        """Strip the quotes from a sheet name, e.g. "'Sheet 1'" -> "Sheet 1"."""
+        # only the enclosing pair is stripped, as a title may itself start or end with a quote
+        return (
+            name[1:-1]
+            if len(name) > 1 and name.startswith("'") and name.endswith("'")
+            else name
+        )
+
+    def _get_sheet_ids(
+        self, spreadsheet_id: str, spreadsheet: Spreadsheet | None = None
+    ) -> dict[str, int]:
+        """Map the title of every sheet in a spreadsheet to its ID with a single request.
+        The sheet ID, ID, and shape caches of every sheet are warmed with the result.
+
+        Args:
+            spreadsheet_id (str): The ID of the spreadsheet.
+            spreadsheet (Spreadsheet, optional): Already fetched spreadsheet metadata to use instead. Defaults to None.
+        """
+        if spreadsheet is None:
+            # always refetched, as the sheets may have changed since; the same mask as `_get_sheet`,
+            # which is then served by the cached response
+            spreadsheet = self.get_spreadsheet(
+                spreadsheet_id, fields="sheets.properties", cache=True, refresh=True
+            )
+        sheet_ids = {}
+
+        with self._cache_lock:
+            for sheet in spreadsheet["sheets"]:
+                properties = sheet["properties"]
+                title, sheet_id = properties["title"], properties["sheetId"]
+                # ranges' sheet names are quoted, as are the "id" and "shape" keys built from them
+                name = normalize_sheet_name(title)
+
+                sheet_ids[title] = sheet_id
+                self._cache[("sheet_id", spreadsheet_id, title)] = sheet_id
+                self._cache[("id", spreadsheet_id, name)] = sheet_id
+
+                if (grid_properties := properties.get("gridProperties")) is not None:
+                    self._cache[("shape", spreadsheet_id, name)] = (
+                        grid_properties["rowCount"],
+                        grid_properties["columnCount"],
+                    )
+
+        return sheet_ids
+
     def has(
         self, spreadsheet_id: str, name: str | None = None, sheet_id: int | None = None
     ):
@@ -348,6 +745,7 @@ class Sheets(DriveBase):
         sheet_id: int | None = None,
         include_grid_data: bool = False,
         ranges: SheetsRange | list[SheetsRange] | None = None,
+        fields: str | None = None,
     ) -> Sheet:
         """Get a sheet from a spreadsheet. Either the name or the ID of the sheet must be provided.
 
@@ -355,14 +753,27 @@ class Sheets(DriveBase):
             spreadsheet_id (str): The ID of the spreadsheet containing the sheet to get.
             name (str, optional): The name of the sheet to get. Defaults to None.
             sheet_id (int, optional): The ID of the sheet to get. Defaults to None.
+            fields (str, optional): A field mask for the spreadsheet response; it must include
+                "sheets.properties(sheetId,title)". Defaults to None.
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
         spreadsheet = self.get_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             include_grid_data=include_grid_data,
             ranges=ranges,
+            fields=fields,
         )
-        sheet_id = self._get_sheet_id(spreadsheet_id, name=name, sheet_id=sheet_id)
+
+        if sheet_id is None:
+            if name is None:
+                raise ValueError(
+                    "Either the name or the ID of the sheet must be provided."
+                )
+
+            # Resolve the name against the sheets just fetched, rather than with another request
+            sheet_id = self._get_sheet_ids(spreadsheet_id, spreadsheet=spreadsheet).get(
+                self._sheet_title(name)
+            )
 
         for sheet in spreadsheet["sheets"]:
             if sheet["properties"]["sheetId"] == sheet_id:
@@ -387,6 +798,8 @@ class Sheets(DriveBase):
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
         sheet_id = self._get_sheet_id(spreadsheet_id, name=name, sheet_id=sheet_id)
+        # titles are unquoted, unlike sheet names within ranges
+        new_name = self._sheet_title(new_name)
 
         body: BatchUpdateSpreadsheetRequest = {
             "requests": [
@@ -398,7 +811,20 @@ class Sheets(DriveBase):
                 }
             ]
         }
-        return self.batch_update_spreadsheet(spreadsheet_id=spreadsheet_id, body=body)
+        response = self.batch_update_spreadsheet(
+            spreadsheet_id=spreadsheet_id, body=body
+        )
+
+        # entries under the old name are stale; the ID is known under the new one,
+        # keyed as `_get_sheet_id` and `id` look it up
+        self._reset_sheet_caches(spreadsheet_id, [sheet_id])
+        with self._cache_lock:
+            self._cache[("sheet_id", spreadsheet_id, new_name)] = sheet_id
+            self._cache[("id", spreadsheet_id, normalize_sheet_name(new_name))] = (
+                sheet_id
+            )
+
+        return response
 
     def add(
         self,
@@ -423,11 +849,20 @@ class Sheets(DriveBase):
 
         if isinstance(names, str):
             names = [names]
-        names = [
-            name
-            for name in names
-            if not ignore_existing or not self.has(spreadsheet_id, name=name)
-        ]
+        if ignore_existing:
+            # sheets with a cached ID are known to exist; only the rest are looked up
+            with self._cache_lock:
+                names = [
+                    name
+                    for name in names
+                    if ("sheet_id", spreadsheet_id, self._sheet_title(name))
+                    not in self._cache
+                ]
+            if len(names):
+                sheet_ids = self._get_sheet_ids(spreadsheet_id)
+                names = [
+                    name for name in names if self._sheet_title(name) not in sheet_ids
+                ]
 
         if len(names) == 0:
             return
@@ -457,11 +892,28 @@ class Sheets(DriveBase):
             ],
         }
 
-        return self.batch_update_spreadsheet(
+        response = self.batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )
 
+        # Seed the caches with the new sheets' properties, sparing a lookup on first use
+        with self._cache_lock:
+            for reply in response.get("replies", []):
+                if (properties := reply.get("addSheet", {}).get("properties")) is None:
+                    continue
+
+                title = properties["title"]
+                grid_properties = properties["gridProperties"]
+
+                self._cache[("sheet_id", spreadsheet_id, title)] = properties["sheetId"]
+                self._cache[("shape", spreadsheet_id, normalize_sheet_name(title))] = (
+                    grid_properties["rowCount"],
+                    grid_properties["columnCount"],
+                )
+
+        return response
+
     def delete(
         self,
         spreadsheet_id: str,
@@ -479,22 +931,18 @@ class Sheets(DriveBase):
 
         if isinstance(names, str):
             names = [names]
-        names = [
-            name
-            for name in names
-            if not ignore_not_existing or self.has(spreadsheet_id, name=name)
-        ]
+
+        sheet_ids = self._get_sheet_ids(spreadsheet_id)
+        if ignore_not_existing:
+            names = [name for name in names if self._sheet_title(name) in sheet_ids]
 
         if len(names) == 0:
             return
 
         def make_body(name: str):
-            sheet_id = self._get_sheet_id(spreadsheet_id, name=name)
-
-            key = ("sheet_id", spreadsheet_id, name)
-
-            if key in self._cache:
-                self._cache.pop(key)
+            sheet_id = sheet_ids.get(self._sheet_title(name))
+            if sheet_id is None:
+                raise ValueError(f"Sheet {name} not found in spreadsheet.")
 
             body: DeleteSheetRequest = {
                 "sheetId": sheet_id,
@@ -512,11 +960,18 @@ class Sheets(DriveBase):
             ],
         }
 
-        return self.batch_update_spreadsheet(
+        response = self.batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )
 
+        self._reset_sheet_caches(
+            spreadsheet_id,
+            [request["deleteSheet"]["sheetId"] for request in body["requests"]],  # type: ignore
+        )
+
+        return response
+
     def values(
         self,
         spreadsheet_id: str,
@@ -562,22 +1017,21 @@ class Sheets(DriveBase):
         ).get("values", [[]])[0][0]
 
     @staticmethod
-    def _add_dupe_suffix(df: pd.DataFrame, suffix: str = DUPE_SUFFIX):
+    def _add_dupe_suffix(cols: list, suffix: str = DUPE_SUFFIX) -> list:
         """
-        Add suffix to duplicate columns in a DataFrame and return modified DataFrame and header
+        Add suffix to duplicate column names and return the new list of names
 
         Args:
-            df: DataFrame to process
+            cols: Column names to process
             suffix: Suffix to append to duplicate columns (default: '__dupe__')
 
         Returns:
-            tuple[pd.DataFrame, list[str]]: (Modified DataFrame, list of new column names)
+            list: The column names, with duplicates suffixed
         """
-        cols = df.columns.tolist()
         new_cols: list = []
         seen: dict = {}
 
-        for i, col in enumerate(cols):
+        for col in cols:
             if col in seen:
                 seen[col] += 1
                 new_cols.append(f"{col}{suffix}{seen[col]}")
@@ -585,9 +1039,18 @@ class Sheets(DriveBase):
                 seen[col] = 0
                 new_cols.append(col)
 
-        df.columns = new_cols  # type: ignore
+        return new_cols
 
-        return df
+    @staticmethod
+    def _fill_blank(value: Any) -> Any:
+        """Replace None/NaN with an empty string."""
+        if (
+            value is None
+            or value is pd.NA
+            or (isinstance(value, float) and value != value)
+        ):
+            return ""
+        return value
 
     def _dict_to_values_align_columns(
         self,
@@ -597,6 +1060,7 @@ class Sheets(DriveBase):
         align_columns: bool = True,
         insert_header: bool = True,
         update: bool = True,
+        header_data: dict[SheetsRange, list[list[Any]]] | None = None,
     ) -> list[list[Any]] | None:
         """Transforms a list of dictionaries into a list of lists, aligning the columns with the header.
         If new columns were added, the header is appended to the right; the header of the sheet is updated.
@@ -609,6 +1073,8 @@ class Sheets(DriveBase):
         align_columns (bool, optional): Whether to align the columns with the header. Defaults to True.
         insert_header (bool, optional): Whether to insert the header if the range starts at the first row. Defaults to True.
         update (bool, optional): Whether to update the values in the sheet. Defaults to True.
+        header_data (dict[SheetsRange, list[list[Any]]], optional): If provided, a header that needs updating is
+            added here to be written alongside the values, rather than updated immediately. Defaults to None.
 
         Returns:
             list[list[Any]]: The aligned values with original data preserved where appropriate.
@@ -622,8 +1088,7 @@ class Sheets(DriveBase):
         sheet_name = sheet_slice.sheet_name
 
         # Get existing header and data
-        header = self.header(spreadsheet_id, sheet_name)
-        header = pd.Index(header).astype(str)
+        header = [str(col) for col in self.header(spreadsheet_id, sheet_name)]
 
         # Get current values
         current_values: list = []
@@ -642,92 +1107,84 @@ class Sheets(DriveBase):
                 value_render_option=ValueRenderOption.formula,
             ).get("values", [])
 
-        # Create DataFrame from current values if they exist
-        current_df: pd.DataFrame = None  # type: ignore
+        # Key the current rows by column name
+        current_rows: list[dict] = []
         if len(current_values) > 0:
-            current_df = pd.DataFrame(current_values)  # type: ignore
-
             if insert_header:
-                current_df.columns = current_df.iloc[0].astype(str)  # type: ignore
-                current_df = current_df.drop(0).reset_index(drop=True)
-                current_df = self._add_dupe_suffix(current_df)
+                current_header = [str(col) for col in current_values[0]]
+                current_values = current_values[1:]
             else:
                 # ensure the header is padded with empty strings to match the current data
-                if len(header) < current_df.shape[1]:
-                    header = header.append(
-                        pd.Index([''] * (current_df.shape[1] - len(header)))
-                    )
-                    current_df.columns = header
-                # ensure the current data is padded with nans to match the header
-                elif len(header) > current_df.shape[1]:
-                    current_df.columns = header[: current_df.shape[1]]
-                    current_df = current_df.reindex(columns=header)
-                else:
-                    current_df.columns = header
-        else:
-            current_df = pd.DataFrame()
+                width = max(map(len, current_values))
+                if len(header) < width:
+                    header += [""] * (width - len(header))
+                current_header = header
 
-        current_df = self._add_dupe_suffix(current_df)
+            current_header = self._add_dupe_suffix(current_header)
+            current_rows = [dict(zip(current_header, row)) for row in current_values]
 
-        # Create DataFrame from new data and handle dupes
-        new_df = pd.DataFrame(rows)
-        new_df = new_df.reindex(columns=list(rows[0].keys()))
-        new_df = self._add_dupe_suffix(new_df)
-
-        # Convert header to list and handle dupes
-        header = pd.DataFrame(columns=header)
+        # Names as written to the sheet, and their de-duplicated keys
+        names = header
         header = self._add_dupe_suffix(header)
-        header = header.columns.tolist()
+
+        # Union of the keys across all rows, in the order they first appear
+        keys = dict.fromkeys(key for row in rows for key in row)
 
         # Check for new columns
-        if len(diff := new_df.columns.difference(header)):
-            header = header + list(diff)
-            header_slc = SheetSlice[sheet_name, 1, ...]
-            self.update(
-                spreadsheet_id,
-                header_slc,
-                [header],
-            )
+        header_set = set(header)
+        diff = [key for key in keys if key not in header_set]
+        if len(diff):
+            names = names + diff
+            header = header + diff
+
             # update the header cache
             self._set_sheet_cache(
                 cache_key="header",
-                value=header,
+                value=names,
                 spreadsheet_id=spreadsheet_id,
                 name=sheet_name,
             )
 
-        for col in header:
-            # If col doesn't exist in either df, create blank column
-            if col not in current_df.columns and col not in new_df.columns:
-                new_df[col] = ''
-                continue
-
-            # Skip if col already exists in new_df
-            if col in new_df.columns:
-                continue
-
-            new_df[col] = current_df[col]
-
-        # Reorder columns to match header
-        new_df = new_df.reindex(columns=header)
-        current_df = current_df.reindex(columns=header)
+        # Columns present in the new data are taken from it;
+        # the rest are preserved from the current values
+        fill_blank = self._fill_blank
+        padded_rows = current_rows + [{}] * (len(rows) - len(current_rows))
+        aligned = [
+            [
+                fill_blank(row.get(col) if col in keys else current_row.get(col))
+                for col in header
+            ]
+            for row, current_row in zip(rows, padded_rows)
+        ]
 
-        # Strip dupe suffixes at the end
-        new_df.columns = new_df.columns.str.replace(
-            fr'{DUPE_SUFFIX}\d+', '', regex=True
-        )
-        current_df.columns = new_df.columns
+        # check to see if the current values are the same as the new values
+        unchanged = len(current_rows) == len(rows) and aligned == [
+            [fill_blank(current_row.get(col)) for col in header]
+            for current_row in current_rows
+        ]
 
-        # Convert to list format, replacing None/NaN with empty string
-        values: list[list] = new_df.fillna("").values.tolist()  # type: ignore
+        # A header inserted at A1 is written along with the values; otherwise, it's
+        # deferred to the caller's request if possible, else updated now
+        if len(diff) and (
+            unchanged or not (insert_header and sheet_slice.columns.start == 1)
+        ):
+            header_slc = SheetSlice[sheet_name, 1, ...]
 
-        if insert_header:
-            values.insert(0, list(new_df.columns))
+            if header_data is not None and not unchanged:
+                header_data[header_slc] = [names]
+            else:
+                self.update(
+                    spreadsheet_id,
+                    header_slc,
+                    [names],
+                )
 
-        # check to see if the current values (of the df) are the same as the new values
-        if current_df.equals(new_df):
+        if unchanged:
             return None
 
+        values: list[list] = [names] if insert_header else []
+        values.extend(aligned)
+
         return values
 
     def _process_sheets_values(
@@ -738,8 +1195,16 @@ class Sheets(DriveBase):
         align_columns: bool = True,
         insert_header: bool = True,
         update: bool = True,
+        header_data: dict[SheetsRange, list[list[Any]]] | None = None,
     ) -> list[list[Any]] | None:
-        if all(isinstance(value, dict) for value in values):
+        # A scalar, or a single row, is written as one row, e.g. update("Sheet1!D2", 3)
+        if not isinstance(values, (list, tuple)):
+            return [[values]]
+        if len(values) and not isinstance(values[0], (list, tuple, dict)):
+            return [list(values)]
+
+        # Rows are homogeneous: either all dicts or all lists, so the first row decides
+        if len(values) and isinstance(values[0], dict):
             return self._dict_to_values_align_columns(
                 spreadsheet_id=spreadsheet_id,
                 sheet_slice=sheet_slice,
@@ -747,6 +1212,7 @@ class Sheets(DriveBase):
                 align_columns=align_columns,
                 insert_header=insert_header,
                 update=update,
+                header_data=header_data,
             )
         else:
             return values  # type: ignore
@@ -803,7 +1269,7 @@ class Sheets(DriveBase):
         sheet_slices = [to_sheet_slice(range_name) for range_name in ranges]
         sheet_names = set(sheet_slice.sheet_name for sheet_slice in sheet_slices)
 
-        # Ensure each sheet exists:
+        # Ensure each sheet exists; this also warms every sheet's shape and ID with one request
         self.add(spreadsheet_id, names=sheet_names)  # type: ignore
 
         shapes = {
@@ -815,31 +1281,45 @@ class Sheets(DriveBase):
             for sheet_slice in sheet_slices
         ]
 
-        def resize_sheet(
-            sheet_slice: SheetSliceT,
-        ):
+        # The largest shape needed by any range within each sheet
+        needed_shapes: dict[str, tuple[int, int]] = {}
+
+        for sheet_slice in sheet_slices:
             sheet_name = sheet_slice.sheet_name
 
             fits, (rows, cols) = self._check_sheet_shape(
                 sheet_slice=sheet_slice,
-                shape=shapes[sheet_slice.sheet_name],
+                shape=shapes[sheet_name],
             )
             if fits:
-                return
+                continue
 
-            self.resize(spreadsheet_id, sheet_name, rows=rows, cols=cols)
+            t_rows, t_cols = needed_shapes.get(sheet_name, shapes[sheet_name])
+            needed_shapes[sheet_name] = (max(rows, t_rows), max(cols, t_cols))
 
-            shape = (rows, cols)
+        if not len(needed_shapes):
+            return
+
+        # Resize every sheet in one batch update
+        sheet_ids = {
+            sheet_name: self.id(spreadsheet_id, sheet_name)
+            for sheet_name in needed_shapes
+        }
+        body: BatchUpdateSpreadsheetRequest = {
+            "requests": [
+                self._resize_request(sheet_ids[sheet_name], rows=rows, cols=cols)
+                for sheet_name, (rows, cols) in needed_shapes.items()
+            ]
+        }
+        self.batch_update_spreadsheet(spreadsheet_id=spreadsheet_id, body=body)
+
+        for sheet_name, shape in needed_shapes.items():
             self._set_sheet_cache(
                 cache_key="shape",
                 value=shape,
                 spreadsheet_id=spreadsheet_id,
                 name=sheet_name,
-            )
-
-        for sheet_slice in sheet_slices:
-            resize_sheet(
-                sheet_slice=sheet_slice,
+                sheet_id=sheet_ids[sheet_name],
             )
 
     @staticmethod
@@ -882,72 +1362,80 @@ class Sheets(DriveBase):
     @staticmethod
     def _flatten_ranges(
         range_names: list[SheetsRange],
-    ) -> list[tuple[tuple[int, int], SheetSliceT]]:
-        """Flatten a list of ranges into a list of contiguous ranges, and the start and stop indexes of each range."""
-
-        sheet_slices = [to_sheet_slice(range_name) for range_name in range_names]
-        sheet_slices = sorted(sheet_slices, key=lambda x: x.rows.start)
-
-        sheet_slice = sheet_slices[0]
-
-        start = sheet_slices[0].rows.start
-        stop = sheet_slices[0].rows.stop
+        row_counts: list[int] | None = None,
+    ) -> list[tuple[list[int], SheetSliceT]]:
+        """Flatten a list of ranges into a list of contiguous ranges, and the indexes of the ranges within each.
 
-        start_ix = 0
-        stop_ix = 0
+        Ranges are merged if they're on the same sheet, span the same columns, and are contiguous row-wise.
 
-        flattened_ranges = []
+        Args:
+            range_names (list[SheetsRange]): The ranges to flatten.
+            row_counts (list[int], optional): The number of rows of values for each range;
+                a range is only merged with the next if its values fill it. Defaults to None.
+        """
+        sheet_slices = [to_sheet_slice(range_name) for range_name in range_names]
+        order = sorted(
+            range(len(sheet_slices)),
+            key=lambda i: (sheet_slices[i].sheet_name, sheet_slices[i].rows.start),
+        )
 
-        for i, t_sheet_slice in enumerate(sheet_slices[1:]):
-            # If the sheet_slice is contiguous row-wise,
-            # and equivalent column-wise, extend the stop index
-            if (
-                stop is not ...
-                and t_sheet_slice.rows.start == stop + 1
-                and t_sheet_slice.columns == sheet_slice.columns
-            ):
-                stop = t_sheet_slice.rows.stop
-                stop_ix += 1
-            else:
-                flat_sheet_slice = SheetSlice[
-                    sheet_slice.sheet_name,
-                    slice(start, stop),
-                    sheet_slice.columns,
-                ]
+        runs: list[list[int]] = []
 
-                flattened_ranges.append(((start_ix, stop_ix + 1), flat_sheet_slice))
+        for i in order:
+            sheet_slice = sheet_slices[i]
 
-                sheet_slice = t_sheet_slice
+            if len(runs):
+                prev_ix = runs[-1][-1]
+                prev_slice = sheet_slices[prev_ix]
+                stop = prev_slice.rows.stop
 
-                start = t_sheet_slice.rows.start
-                stop = t_sheet_slice.rows.stop
+                # If the sheet_slice is contiguous row-wise,
+                # and equivalent column-wise, extend the current run
+                if (
+                    stop is not ...
+                    and sheet_slice.sheet_name == prev_slice.sheet_name
+                    and sheet_slice.rows.start == stop + 1
+                    and sheet_slice.columns == prev_slice.columns
+                    and (
+                        row_counts is None
+                        or row_counts[prev_ix] == stop - prev_slice.rows.start + 1
+                    )
+                ):
+                    runs[-1].append(i)
+                    continue
 
-                start_ix = i + 1
-                stop_ix = i + 1
+            runs.append([i])
 
-        flat_sheet_slice = SheetSlice[
-            sheet_slice.sheet_name,
-            slice(start, stop),
-            sheet_slice.columns,
+        return [
+            (
+                ixs,
+                SheetSlice[
+                    sheet_slices[ixs[0]].sheet_name,
+                    slice(sheet_slices[ixs[0]].rows.start, sheet_slices[ixs[-1]].rows.stop),
+                    sheet_slices[ixs[0]].columns,
+                ],
+            )
+            for ixs in runs
         ]
-        flattened_ranges.append(((start_ix, stop_ix + 1), flat_sheet_slice))
-
-        return flattened_ranges
 
     @staticmethod
     def _flatten_value_ranges(
         range_names: list[SheetsRange],
         values: list[SheetsValues],
     ):
-        flat_ranges = Sheets._flatten_ranges(range_names)
+        flat_ranges = Sheets._flatten_ranges(
+            range_names, row_counts=[len(t_values) for t_values in values]
+        )
 
         flat_data: dict[SheetsRange, SheetsValues] = {}
 
-        for (start, stop), sheet_slice in flat_ranges:
-            if stop > start + 1:
-                flat_data[sheet_slice] = list(itertools.chain(*values[start:stop]))
+        for ixs, sheet_slice in flat_ranges:
+            if len(ixs) > 1:
+                flat_data[sheet_slice] = list(
+                    itertools.chain.from_iterable(values[i] for i in ixs)
+                )
             else:
-                flat_data[sheet_slice] = values[start]
+                flat_data[sheet_slice] = values[ixs[0]]
 
         return flat_data
 
@@ -955,6 +1443,23 @@ class Sheets(DriveBase):
     def _get_row_size(row: list[Any]) -> int:
         return sum(len(str(cell)) for cell in row)
 
+    @staticmethod
+    def _get_values_size(values: SheetsValues) -> int:
+        """Estimates the serialized size of values, as `_get_row_size` does, without serializing them."""
+        # a scalar, or a flat row, is written as a single row; see `_process_sheets_values`
+        if not isinstance(values, (list, tuple)):
+            values = [[values]]
+        elif len(values) and not isinstance(values[0], (list, tuple, dict)):
+            values = [values]  # type: ignore
+
+        size = 0
+        for row in values:
+            cells = list(row.values()) if isinstance(row, dict) else row
+
+            size += Sheets._get_row_size(cells) + VALUES_CELL_OVERHEAD * (len(cells) + 1)  # type: ignore
+
+        return size
+
     def _update_chunked(
         self,
         spreadsheet_id: str,
@@ -982,13 +1487,16 @@ class Sheets(DriveBase):
         spreadsheet_id = parse_file_id(spreadsheet_id)
         sheet_slice = to_sheet_slice(range_name)
 
-        # Process values with column alignment if needed
+        # Process values with column alignment if needed;
+        # a header that needs updating is written in the same request
+        header_data: dict[SheetsRange, list[list[Any]]] = {}
         processed_values = self._process_sheets_values(
             spreadsheet_id=spreadsheet_id,
             sheet_slice=sheet_slice,
             values=values,
             align_columns=align_columns,
             update=update,
+            header_data=header_data,
         )
 
         if not processed_values or processed_values is None:
@@ -1004,8 +1512,26 @@ class Sheets(DriveBase):
         if chunk_size_bytes is None or total_size <= chunk_size_bytes:
             self._ensure_sheet_shape(
                 spreadsheet_id=spreadsheet_id,
-                ranges=[sheet_slice],
+                ranges=[sheet_slice, *header_data.keys()],
             )
+
+            if len(header_data):
+                body: BatchUpdateValuesRequest = {
+                    "valueInputOption": value_input_option.value,
+                    "data": [
+                        {"range": str(range_name), "values": t_values}
+                        for range_name, t_values in header_data.items()
+                    ]
+                    + [{"range": str(sheet_slice), "values": processed_values}],
+                }
+                request = self.spreadsheets.values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body,
+                )
+                response = self.execute(request)
+                # the response of the values' update, as if made alone
+                return response.get("responses", [{}])[-1]  # type: ignore
+
             request = self.spreadsheets.values().update(
                 spreadsheetId=spreadsheet_id,
                 range=str(sheet_slice),
@@ -1026,6 +1552,15 @@ class Sheets(DriveBase):
 
             return current_size > chunk_size_bytes
 
+        if len(header_data):
+            self._batch_update(
+                spreadsheet_id=spreadsheet_id,
+                data=header_data,  # type: ignore
+                value_input_option=value_input_option,
+                align_columns=False,
+                ensure_shape=True,
+            )
+
         for _, t_sheet_slice in self._chunk_range(
             range_name=sheet_slice,
             rows=len(processed_values),
@@ -1060,9 +1595,12 @@ class Sheets(DriveBase):
     ) -> UpdateValuesResponse | None:
         """Updates a range of values in a spreadsheet.
 
-        If `values` is a list of dicts, the keys of the first dict will be used as the header row.
-        Further, if the input is a list of dicts and `align_columns` is True, the columns of the spreadsheet
-        will be aligned with the keys of the first dict.
+        If `values` is a list of dicts, the union of their keys, in the order each first appears,
+        is used as the header row. Further, if the input is a list of dicts and `align_columns` is True,
+        the columns of the spreadsheet will be aligned with that union: keys missing from the header
+        are appended to it. A key missing from a row, but present in another, is blanked in that row;
+        columns absent from every row keep their current values.
+        A single value, or a flat list of values, is written as a single row.
 
         Large updates are automatically chunked to avoid API timeouts.
 
@@ -1071,7 +1609,7 @@ class Sheets(DriveBase):
             range_name (SheetsRange): The range to update.
             values (SheetsValues): The values to update.
             value_input_option (ValueInputOption, optional): How the input data should be interpreted.
-            align_columns (bool, optional): Whether to align the columns with the keys of the first row.
+            align_columns (bool, optional): Whether to align the columns with the keys of all of the rows.
             ensure_shape (bool, optional): Whether to ensure the sheet has enough rows/columns.
             chunk_size_bytes (int, optional): Maximum size in bytes for each chunk. If None, no chunking is done.
             keep_values (bool, optional): Whether to keep the current sheets' values and dynamically update in-place.
@@ -1113,8 +1651,36 @@ class Sheets(DriveBase):
             values=list(data.values()),
         )
 
+        # Sheets whose dict rows are aligned to their header
+        align_sheet_names = (
+            {
+                to_sheet_slice(range_name).sheet_name
+                for range_name, values in flat_data.items()
+                if len(values) and isinstance(values[0], dict)
+            }
+            if align_columns
+            else set()
+        )
+        self._prefetch_headers(spreadsheet_id, align_sheet_names)
+
+        # Shapes are read per sheet to align dict rows and to ensure the sheets fit the data;
+        # if any are uncached, every sheet's shape and ID is fetched at once
+        if ensure_shape or (update and len(align_sheet_names)):
+            sheet_names = {
+                to_sheet_slice(range_name).sheet_name for range_name in flat_data
+            }
+            with self._cache_lock:
+                uncached = any(
+                    ("shape", spreadsheet_id, sheet_name) not in self._cache
+                    for sheet_name in sheet_names
+                )
+            if uncached:
+                self._get_sheet_ids(spreadsheet_id)
+
         flat_range_names: list = []
         flat_values: list = []
+        # Headers that need updating are written in the same request
+        header_data: dict[SheetsRange, list[list[Any]]] = {}
 
         for range_name, values in flat_data.items():
             sheet_slice = to_sheet_slice(range_name)
@@ -1124,6 +1690,7 @@ class Sheets(DriveBase):
                 values=values,
                 align_columns=align_columns,
                 update=update,
+                header_data=header_data,
             )
             if values is None:
                 continue
@@ -1146,7 +1713,9 @@ class Sheets(DriveBase):
                 "range": str(range_name),
                 "values": values,
             }
-            for range_name, values in flat_data.items()
+            for range_name, values in itertools.chain(
+                header_data.items(), flat_data.items()
+            )
         ]  # type: ignore
 
         if ensure_shape:
@@ -1170,46 +1739,107 @@ class Sheets(DriveBase):
                 )
             return None
         else:
-            body: BatchUpdateValuesRequest = {
-                "valueInputOption": value_input_option.value,
-                "data": new_data,
-            }
+            # Split the payload so each request stays below the request size limit
+            responses: list[BatchUpdateValuesResponse] = []
 
-            request = self.spreadsheets.values().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body,
-            )
+            for data_chunk in self._chunk_value_ranges(
+                new_data, chunk_size_bytes=DEFAULT_BATCH_SIZE_BYTES
+            ):
+                body: BatchUpdateValuesRequest = {
+                    "valueInputOption": value_input_option.value,
+                    "data": data_chunk,
+                }
 
-            return self.execute(request)  # type: ignore
+                request = self.spreadsheets.values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body,
+                )
+                responses.append(self.execute(request))  # type: ignore
 
-    def batch_update(
-        self,
-        spreadsheet_id: str,
-        data: dict[SheetsRange, SheetsValues],
-        value_input_option: ValueInputOption = ValueInputOption.user_entered,
-        align_columns: bool = True,
-        batch_size: int | None = None,
-        ensure_shape: bool = False,
-        chunk_size_bytes: int | None = None,
-        keep_values: bool = True,
-    ):
-        """Updates a series of range values in a spreadsheet. Much faster version of calling `update` multiple times.
-        See `update` for more details.
+            return self._merge_batch_update_values_responses(responses)
 
-        If the `batch_size` is None, all updates will be batched together. Otherwise, the updates will be batched by the following
+    @staticmethod
+    def _chunk_value_ranges(
+        value_ranges: list[ValueRange], chunk_size_bytes: int
+    ) -> Generator[list[ValueRange], None, None]:
+        """Greedily packs value ranges into chunks of at most `chunk_size_bytes` (estimated) each.
+        A single value range larger than the limit is yielded alone.
+        """
+        chunk: list[ValueRange] = []
+        chunk_size = 0
+
+        for value_range in value_ranges:
+            size = Sheets._get_values_size(value_range["values"])
+
+            if len(chunk) and chunk_size + size > chunk_size_bytes:
+                yield chunk
+                chunk, chunk_size = [], 0
+
+            chunk.append(value_range)
+            chunk_size += size
+
+        if len(chunk):
+            yield chunk
+
+    @staticmethod
+    def _merge_batch_update_values_responses(
+        responses: list[BatchUpdateValuesResponse],
+    ) -> BatchUpdateValuesResponse:
+        """Combines the responses of a batch update split across several requests."""
+        if len(responses) == 1:
+            return responses[0]
+
+        merged: BatchUpdateValuesResponse = {
+            "spreadsheetId": responses[0].get("spreadsheetId"),  # type: ignore
+            "responses": [
+                t_response
+                for response in responses
+                for t_response in response.get("responses", [])
+            ],
+        }
+        for key in ("totalUpdatedRows", "totalUpdatedCells"):
+            merged[key] = sum(response.get(key, 0) for response in responses)  # type: ignore
+        merged["totalUpdatedColumns"] = max(
+            response.get("totalUpdatedColumns", 0) for response in responses
+        )
+
+        merged["totalUpdatedSheets"] = len(
+            {t_response.get("updatedRange", "").split("!")[0] for t_response in merged["responses"]}  # type: ignore
+        )
+
+        return merged
+
+    def batch_update(
+        self,
+        spreadsheet_id: str,
+        data: dict[SheetsRange, SheetsValues],
+        value_input_option: ValueInputOption = ValueInputOption.user_entered,
+        align_columns: bool = True,
+        batch_size: int | None = None,
+        ensure_shape: bool = False,
+        chunk_size_bytes: int | None = None,
+        keep_values: bool = True,
+        batch_size_bytes: int | None = DEFAULT_BATCH_SIZE_BYTES,
+    ):
+        """Updates a series of range values in a spreadsheet. Much faster version of calling `update` multiple times.
+        See `update` for more details.
+
+        If the `batch_size` is None, all updates will be batched together. Otherwise, the updates will be batched by the following
         rules:
         -   If the number of updates is greater than `batch_size` AND
         -   If the time between the first update and the last update is greater than `THROTTLE_TIME`.
+        -   OR, if the estimated size of the batched updates exceeds `batch_size_bytes`, regardless of the time elapsed.
 
         Args:
             spreadsheet_id (str): The spreadsheet to update.
             data (dict[SheetsRange, SheetsValues]): The data to update.
             value_input_option (ValueInputOption, optional): How the input data should be interpreted. Defaults to ValueInputOption.user_entered.
-            align_columns (bool, optional): Whether to align the columns of the spreadsheet with the keys of the first row of the values. Defaults to True.
+            align_columns (bool, optional): Whether to align the columns of the spreadsheet with the keys of all of the rows of the values. Defaults to True.
             batch_size (int | None, optional): The number of updates to batch together. If None, all updates will be batched together. Defaults to None.
             ensure_shape (bool, optional): Whether to ensure the sheet has enough rows/columns. Defaults to False.
             chunk_size_bytes (int, optional): Maximum size in bytes for each chunk. If None, no chunking is done. Defaults to None.
             keep_values (bool, optional): Whether to keep the current sheets' values and dynamically update in-place. Defaults to True.
+            batch_size_bytes (int | None, optional): The estimated payload size at which batched updates are flushed. If None, only `batch_size` is considered. Defaults to DEFAULT_BATCH_SIZE_BYTES.
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
 
@@ -1224,49 +1854,141 @@ class Sheets(DriveBase):
                 update=keep_values,
             )
 
-        batched_data = self._batched_data[spreadsheet_id]
+        with self._batched_lock:
+            if not self._atexit_registered:
+                atexit.register(self.batch_update_remaining_auto)
+                self._atexit_registered = True
 
-        if data is not None:
-            self._batched_data[spreadsheet_id] |= data
+            batched_data = self._batched_data[spreadsheet_id]
 
-        if len(batched_data) >= batch_size and not (
-            self._batch_update_throttler.dt() > 0
-        ):
-            self._batch_update(
-                spreadsheet_id=spreadsheet_id,
-                data=self._batched_data[spreadsheet_id],
-                value_input_option=value_input_option,
-                align_columns=align_columns,
-                ensure_shape=ensure_shape,
-                chunk_size_bytes=chunk_size_bytes,
-                update=keep_values,
+            if data is not None:
+                for range_name, values in data.items():
+                    # canonicalize the ranges, so that equivalent ranges collapse onto one entry
+                    range_name = str(to_sheet_slice(range_name))
+
+                    if batch_size_bytes is not None:
+                        # a replaced entry's values are no longer sent
+                        if (replaced := batched_data.get(range_name)) is not None:
+                            self._batched_bytes[
+                                spreadsheet_id
+                            ] -= self._get_values_size(replaced)
+
+                        self._batched_bytes[spreadsheet_id] += self._get_values_size(
+                            values
+                        )
+
+                    batched_data[range_name] = values
+
+            over_size = (
+                batch_size_bytes is not None
+                and self._batched_bytes[spreadsheet_id] >= batch_size_bytes
             )
-            self._batched_data[spreadsheet_id].clear()
-            self._batch_update_throttler.reset()
-        else:
-            return None
+
+            if not (
+                over_size
+                or (
+                    len(batched_data) >= batch_size
+                    and not (self._batch_update_throttler.dt() > 0)
+                )
+            ):
+                return None
+
+            batched_data = self._pop_batched_data(spreadsheet_id)
+
+        self._flush_batched_data(
+            spreadsheet_id=spreadsheet_id,
+            batched_data=batched_data,
+            value_input_option=value_input_option,
+            align_columns=align_columns,
+            ensure_shape=ensure_shape,
+            chunk_size_bytes=chunk_size_bytes,
+            update=keep_values,
+        )
+        self._batch_update_throttler.reset()
+
+    def _pop_batched_data(self, spreadsheet_id: str) -> dict[str, SheetsValues]:
+        """Swaps out a spreadsheet's batched data, so that concurrent writers start a fresh batch.
+        Must be called with `_batched_lock` held."""
+        self._batched_bytes.pop(spreadsheet_id, None)
+        return self._batched_data.pop(spreadsheet_id, {})
+
+    def _flush_batched_data(
+        self,
+        spreadsheet_id: str,
+        batched_data: dict[str, SheetsValues],
+        **kwargs: Any,
+    ) -> BatchUpdateValuesResponse | None:
+        """Updates a spreadsheet with data swapped out by `_pop_batched_data`.
+        If the update fails, the data is returned to the batch, beneath anything batched since."""
+        try:
+            return self._batch_update(
+                spreadsheet_id=spreadsheet_id, data=batched_data, **kwargs  # type: ignore
+            )
+        except BaseException:
+            with self._batched_lock:
+                newer_data = self._batched_data.get(spreadsheet_id, {})
+                self._batched_data[spreadsheet_id] = {**batched_data, **newer_data}
+                # only the entries that weren't since replaced are counted again
+                self._batched_bytes[spreadsheet_id] += sum(
+                    self._get_values_size(values)
+                    for range_name, values in batched_data.items()
+                    if range_name not in newer_data
+                )
+            raise
 
     def batched_update_remaining(self, spreadsheet_id: str):
         """Updates any remaining batched data that's been left over from previous calls to `batch_update`."""
         spreadsheet_id = parse_file_id(spreadsheet_id)
-        batched_data = self._batched_data[spreadsheet_id]
+
+        with self._batched_lock:
+            batched_data = self._pop_batched_data(spreadsheet_id)
 
         if len(batched_data) == 0:
             return None
 
-        res = self._batch_update(
-            spreadsheet_id=spreadsheet_id,
-            data=batched_data,
+        return self._flush_batched_data(
+            spreadsheet_id=spreadsheet_id, batched_data=batched_data
         )
 
-        self._batched_data[spreadsheet_id].clear()
+    def batch_update_remaining_auto(self):
+        """Updates any remaining batched data that's been left over from previous calls to `batch_update`.
+
+        Each spreadsheet is flushed independently, and so concurrently; if threads can no longer be
+        started (e.g. when called at interpreter exit), the spreadsheets are flushed serially."""
+        # snapshot the keys, as flushing may run concurrently with new batch_update calls
+        spreadsheet_ids = [
+            spreadsheet_id
+            for spreadsheet_id in list(self._batched_data.keys())
+            if self._batched_data.get(spreadsheet_id)
+        ]
+
+        if len(spreadsheet_ids) > 1:
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_FLUSH_WORKERS, len(spreadsheet_ids))
+                ) as executor:
+                    futures = [
+                        executor.submit(self.batched_update_remaining, spreadsheet_id)
+                        for spreadsheet_id in spreadsheet_ids
+                    ]
+            except RuntimeError:
+                pass
+            else:
+                # every flush has been attempted; surface the first failure, if any
+                for future in futures:
+                    future.result()
+                return
 
-        return res
+        # a failed flush mustn't lose the other spreadsheets' data
+        errors: list[BaseException] = []
+        for spreadsheet_id in spreadsheet_ids:
+            try:
+                self.batched_update_remaining(spreadsheet_id)
+            except Exception as e:
+                errors.append(e)
 
-    def batch_update_remaining_auto(self):
-        """Updates any remaining batched data that's been left over from previous calls to `batch_update`."""
-        for spreadsheet_id in self._batched_data:
-            self.batched_update_remaining(spreadsheet_id)
+        if len(errors):
+            raise errors[0]
 
     def append(
         self,
@@ -1291,7 +2013,7 @@ class Sheets(DriveBase):
             values (list[list[Any]]): The values to append.
             insert_data_option (InsertDataOption, optional): How the input data should be inserted. Defaults to InsertDataOption.overwrite.
             value_input_option (ValueInputOption, optional): How the input data should be interpreted. Defaults to ValueInputOption.user_entered.
-            align_columns (bool, optional): Whether to align the columns of the spreadsheet with the keys of the first row of the values. Defaults to True.
+            align_columns (bool, optional): Whether to align the columns of the spreadsheet with the keys of all of the rows of the values. Defaults to True.
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
         sheet_slice = to_sheet_slice(range_name)
@@ -1323,41 +2045,55 @@ class Sheets(DriveBase):
             insertDataOption=insert_data_option.value,
             valueInputOption=value_input_option.value,
         )
+        response = self.execute(request)
 
-        return self.execute(request)  # type: ignore
+        # appending may grow the grid
+        for cache_key in ("sheet", "spreadsheet", "shape"):
+            self._reset_spreadsheet_cache(
+                cache_key=cache_key, spreadsheet_id=spreadsheet_id
+            )
+
+        return response  # type: ignore
 
     def get_append_range(
         self,
         spreadsheet_id: str,
         range_name: SheetsRange = DEFAULT_SHEET_NAME,
     ) -> SheetSliceT:
-        """Get the range wherein Google Sheets would append data.
+        """Get the range wherein Google Sheets would append data: the first row after the last row
+        holding values within the range, starting at the range's first column.
 
-        This is done by first appending a null value to the sheet, checking the range of the appended value, and then deleting it.
+        This is a read-only probe, relying on the values API omitting trailing empty rows.
+        The range's first column is read first, as it usually spans the whole table;
+        only the rows below its last value are then read across every column.
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
         sheet_slice = to_sheet_slice(range_name)
+        sheet_name = sheet_slice.sheet_name
 
-        res = self.append(
-            spreadsheet_id=spreadsheet_id,
-            range_name=sheet_slice,
-            values=[[]],
-            value_input_option=ValueInputOption.user_entered,
-            align_columns=False,
-        )
+        if sheet_slice.rows.stop is ... or sheet_slice.columns.stop is ...:
+            sheet_slice = sheet_slice.with_shape(self.shape(spreadsheet_id, sheet_name))
 
-        if res is None:
-            return sheet_slice
+        rows, cols = sheet_slice.rows, sheet_slice.columns
 
-        appended_range = res["updates"]["updatedRange"] # type: ignore
-        appended_range_slc = to_sheet_slice(appended_range) # type: ignore
+        def count_rows(range_name: SheetSliceT) -> int:
+            # only the values are returned, not the range nor the major dimension
+            return len(
+                self.values(
+                    spreadsheet_id=spreadsheet_id, range_name=range_name, fields="values"
+                ).get("values", [])
+            )
 
-        self.clear(
-            spreadsheet_id=spreadsheet_id,
-            range_name=appended_range,
+        next_row = rows.start + count_rows(
+            SheetSlice[sheet_name, rows.start : rows.stop, cols.start]
         )
 
-        return appended_range_slc # type: ignore
+        if cols.stop > cols.start and next_row <= rows.stop:
+            next_row += count_rows(
+                SheetSlice[sheet_name, next_row : rows.stop, cols.start : cols.stop]
+            )
+
+        return SheetSlice[sheet_name, next_row, cols.start]
 
     def clear(
         self,
@@ -1379,6 +2115,32 @@ class Sheets(DriveBase):
 
         return self.execute(request)  # type: ignore
 
+    @staticmethod
+    def _resize_request(sheet_id: int, rows: int, cols: int) -> Request:
+        return {
+            "updateSheetProperties": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "gridProperties": {
+                        "rowCount": rows,
+                        "columnCount": cols,
+                    },
+                },
+                "fields": "gridProperties.rowCount,gridProperties.columnCount",
+            }
+        }
+
+    @staticmethod
+    def _clear_request(sheet_id: int, fields: str = "userEnteredFormat") -> Request:
+        return {
+            "updateCells": {
+                "range": {
+                    "sheetId": sheet_id,
+                },
+                "fields": fields,
+            }
+        }
+
     def resize(
         self,
         spreadsheet_id: str,
@@ -1398,28 +2160,29 @@ class Sheets(DriveBase):
         sheet_slice = to_sheet_slice(sheet_name)
         sheet_name = sheet_slice.sheet_name
 
-        sheet_id = self.get(spreadsheet_id, name=sheet_name)["properties"]["sheetId"]
+        sheet_id = self.id(spreadsheet_id, sheet_name)
         body: BatchUpdateSpreadsheetRequest = {
-            "requests": [
-                {
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id,
-                            "gridProperties": {
-                                "rowCount": rows,
-                                "columnCount": cols,
-                            },
-                        },
-                        "fields": "gridProperties.rowCount,gridProperties.columnCount",
-                    }
-                }
-            ]
+            "requests": [self._resize_request(sheet_id, rows=rows, cols=cols)]
         }
-        return self.batch_update_spreadsheet(
+        response = self._queue_batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )
 
+        # a queued resize hasn't been made yet: the cached shape is reset once it's flushed
+        if response is None:
+            return response
+
+        self._set_sheet_cache(
+            cache_key="shape",
+            value=(rows, cols),
+            spreadsheet_id=spreadsheet_id,
+            name=sheet_name,
+            sheet_id=sheet_id,
+        )
+
+        return response
+
     def clear_formatting(
         self,
         spreadsheet_id: str,
@@ -1435,20 +2198,11 @@ class Sheets(DriveBase):
         sheet_slice = to_sheet_slice(sheet_name)
         sheet_name = sheet_slice.sheet_name
 
-        sheet_id = self.get(spreadsheet_id, name=sheet_name)["properties"]["sheetId"]
+        sheet_id = self.id(spreadsheet_id, sheet_name)
         body: BatchUpdateSpreadsheetRequest = {
-            "requests": [
-                {
-                    "updateCells": {
-                        "range": {
-                            "sheetId": sheet_id,
-                        },
-                        "fields": "userEnteredFormat",
-                    }
-                }
-            ]
+            "requests": [self._clear_request(sheet_id)]
         }
-        return self.batch_update_spreadsheet(
+        return self._queue_batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )
@@ -1479,62 +2233,131 @@ class Sheets(DriveBase):
 
         header_slice = SheetSlice[sheet_name, 1, ...]
 
-        header = self.values(
-            spreadsheet_id=spreadsheet_id, range_name=header_slice
-        ).get("values", [])
-        header_fmt = self.get_format(
-            spreadsheet_id=spreadsheet_id, range_name=header_slice
-        )
+        # the header's values, formats, and dimension sizes are read in a single request
+        header_cells: list[CellData] = []
+        column_sizes: list[int | None] = []
+        row_sizes: list[int | None] = []
+        if preserve_header:
+            spreadsheet = self.get_spreadsheet(
+                spreadsheet_id=spreadsheet_id,
+                include_grid_data=True,
+                ranges=header_slice,
+                fields="sheets.data(rowData.values(userEnteredValue,userEnteredFormat),"
+                "rowMetadata.pixelSize,columnMetadata.pixelSize)",
+            )
+            data = spreadsheet["sheets"][0]["data"][0]
 
-        self.clear(
-            spreadsheet_id=spreadsheet_id,
-            range_name=sheet_name,
-        )
+            if any(
+                "userEnteredValue" in cell
+                for row in data.get("rowData", [])[:1]
+                for cell in row.get("values", [])
+            ):
+                header_cells = data["rowData"][0]["values"]
+                column_sizes = [
+                    metadata.get("pixelSize") for metadata in data["columnMetadata"]
+                ]
+                row_sizes = [metadata.get("pixelSize") for metadata in data["rowMetadata"]]
+
+        sheet_id = self.id(spreadsheet_id, sheet_name)
 
         # reset the sheet to the default shape
         if resize:
-            cols = (
-                max(len(header), DEFAULT_SHEET_SHAPE[1])
-                if len(header) and preserve_header
-                else DEFAULT_SHEET_SHAPE[1]
-            )
+            rows = DEFAULT_SHEET_SHAPE[0]
+            cols = max(len(header_cells), DEFAULT_SHEET_SHAPE[1])
+        else:
+            rows, cols = self.shape(spreadsheet_id, sheet_name)
 
-            self.resize(
-                spreadsheet_id,
-                sheet_name=sheet_name,
-                rows=DEFAULT_SHEET_SHAPE[0],
+        # resizing, clearing, and restoring the header are all sent as a single batch update
+        requests = self._reset_sheet_requests(
+            sheet_id, rows=rows, cols=cols, resize=resize
+        )
+        if len(header_cells):
+            requests += self._restore_header_requests(
+                sheet_id,
+                rows=rows,
                 cols=cols,
+                header_cells=header_cells,
+                column_sizes=column_sizes,
+                row_sizes=row_sizes,
             )
 
-        # reset the columns to the default width
-        self.resize_dimensions(
-            spreadsheet_id,
-            sheet_name=sheet_name,
-            dimension=SheetsDimension.columns,
-        )
-
-        self.clear_formatting(
+        self.batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
-            sheet_name=sheet_name,
+            body={"requests": requests},
         )
 
-        if preserve_header and len(header):
-            self.update(
-                spreadsheet_id=spreadsheet_id,
-                range_name=header_slice,
-                values=header,
-            )
-            self.format(
+        if resize:
+            self._set_sheet_cache(
+                cache_key="shape",
+                value=(rows, cols),
                 spreadsheet_id=spreadsheet_id,
-                range_names=header_slice,
-                sheets_format=header_fmt[0],
-                update=True,
+                name=sheet_name,
+                sheet_id=sheet_id,
             )
-        else:
+
+        if not len(header_cells):
             self._reset_sheet_cache(
                 cache_key="header", spreadsheet_id=spreadsheet_id, name=sheet_name
             )
 
+    @staticmethod
+    def _reset_sheet_requests(
+        sheet_id: int, rows: int, cols: int, resize: bool = True
+    ) -> list[Request]:
+        """Requests to reset a sheet: resize it to (rows, cols) if `resize`, reset the column widths,
+        then clear all values and formatting."""
+        requests: list[Request] = (
+            [Sheets._resize_request(sheet_id, rows=rows, cols=cols)] if resize else []
+        )
+        requests += Sheets._resize_dimension(
+            sheet={
+                "properties": {
+                    "sheetId": sheet_id,
+                    "gridProperties": {"rowCount": rows, "columnCount": cols},
+                }
+            },
+            sizes=100,
+            dimension=SheetsDimension.columns,
+        )
+        requests.append(
+            Sheets._clear_request(sheet_id, fields="userEnteredValue,userEnteredFormat")
+        )
+        return requests
+
+    @staticmethod
+    def _restore_header_requests(
+        sheet_id: int,
+        rows: int,
+        cols: int,
+        header_cells: list[CellData],
+        column_sizes: list[int | None],
+        row_sizes: list[int | None],
+    ) -> list[Request]:
+        """Requests to write back a sheet's first row, as read with its grid data: each cell's values and formats,
+        the column widths, and the row's height."""
+        sheet: Sheet = {
+            "properties": {
+                "sheetId": sheet_id,
+                "gridProperties": {"rowCount": rows, "columnCount": cols},
+            }
+        }
+        requests: list[Request] = [
+            {
+                "updateCells": {
+                    "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                    "rows": [{"values": header_cells}],
+                    "fields": "userEnteredValue,userEnteredFormat",
+                }
+            }
+        ]
+        requests += Sheets._resize_dimension(
+            sheet=sheet, sizes=column_sizes, dimension=SheetsDimension.columns
+        )
+        requests += Sheets._resize_dimension(
+            sheet=sheet, sizes=row_sizes, dimension=SheetsDimension.rows
+        )
+        return requests
+
     @staticmethod
     def _create_format_body(
         sheet_id: int,
@@ -1543,6 +2366,7 @@ class Sheets(DriveBase):
         cell_format: CellFormat,
         end_row: int | None = None,
         end_col: int | None = None,
+        fields: str = "userEnteredFormat",
     ) -> Request:
         """Creates a batch update request body for formatting a range of cells.
         The ranges herein are 1-indexed.
@@ -1554,6 +2378,7 @@ class Sheets(DriveBase):
             cell_format (CellFormat): The format to apply to the range.
             end_row (int, optional): The ending row of the range to format. Defaults to None.
             end_col (int, optional): The ending column of the range to format. Defaults to None.
+            fields (str, optional): The field mask of the format to overwrite. Defaults to "userEnteredFormat".
         """
         end_row = end_row if end_row is not None else start_row
         end_col = end_col if end_col is not None else start_col
@@ -1573,10 +2398,26 @@ class Sheets(DriveBase):
                 "cell": {
                     "userEnteredFormat": cell_format,
                 },
-                "fields": "userEnteredFormat",
+                "fields": fields,
             }
         }
 
+    @staticmethod
+    def _format_fields(cell_format: dict, prefix: str = "userEnteredFormat") -> list[str]:
+        """Returns the field mask paths of every leaf value within a cell format.
+
+        Masking a repeatCell request with these overwrites only the given leaves,
+        which is the server-side equivalent of `deep_update`-ing each cell's format."""
+        fields: list[str] = []
+
+        for k, v in cell_format.items():
+            if isinstance(v, dict):
+                fields += Sheets._format_fields(v, prefix=f"{prefix}.{k}")
+            else:
+                fields.append(f"{prefix}.{k}")
+
+        return fields
+
     @staticmethod
     def _create_cell_format(
         bold: bool | None = None,
@@ -1596,67 +2437,44 @@ class Sheets(DriveBase):
         number_format: NumberFormat | None = None,
         cell_format: CellFormat | None = None,
     ) -> CellFormat:
-        text_format: TextFormat = {}
-        if bold is not None:
-            text_format["bold"] = bold
-        if italic is not None:
-            text_format["italic"] = italic
-        if underline is not None:
-            text_format["underline"] = underline
-        if strikethrough is not None:
-            text_format["strikethrough"] = strikethrough
-        if font_size is not None:
-            text_format["fontSize"] = font_size
-        if font_family is not None:
-            text_format["fontFamily"] = font_family
-        if text_color is not None:
-            text_format["foregroundColor"] = (
-                hex_to_rgb(text_color) if isinstance(text_color, str) else text_color
-            )
-
-        cell_format_dict: CellFormat = {}
-        if background_color is not None:
-            cell_format_dict["backgroundColor"] = (
-                hex_to_rgb(background_color)
-                if isinstance(background_color, str)
-                else background_color
-            )
-
-        if padding is not None:
-            padding_dict: Padding = {}
-            if isinstance(padding, int):
-                padding_dict = {
-                    "top": padding,
-                    "bottom": padding,
-                    "left": padding,
-                    "right": padding,
-                }
-            elif isinstance(padding, dict):
-                padding_dict = padding
-            cell_format_dict["padding"] = padding_dict
-
-        if horizontal_alignment is not None:
-            cell_format_dict["horizontalAlignment"] = horizontal_alignment.value
-
-        if vertical_alignment is not None:
-            cell_format_dict["verticalAlignment"] = vertical_alignment.value
-
-        if wrap_strategy is not None:
-            cell_format_dict["wrapStrategy"] = wrap_strategy.value
-
-        if text_direction is not None:
-            cell_format_dict["textDirection"] = text_direction.value
+        # the arguments named by the TEXT_FORMAT_FIELDS and CELL_FORMAT_FIELDS specs
+        args: dict[str, Any] = {
+            "bold": bold,
+            "italic": italic,
+            "underline": underline,
+            "strikethrough": strikethrough,
+            "font_size": font_size,
+            "font_family": font_family,
+            "text_color": text_color,
+            "background_color": background_color,
+            "padding": padding,
+            "horizontal_alignment": horizontal_alignment,
+            "vertical_alignment": vertical_alignment,
+            "wrap_strategy": wrap_strategy,
+            "text_direction": text_direction,
+            "hyperlink_display_type": hyperlink_display_type,
+            "number_format": number_format,
+        }
 
-        if hyperlink_display_type is not None:
-            cell_format_dict["hyperlinkDisplayType"] = hyperlink_display_type.value
+        text_format: TextFormat = {
+            field: (value if convert is None else convert(value))
+            for name, field, convert in TEXT_FORMAT_FIELDS
+            if (value := args[name]) is not None
+        }  # type: ignore
+        cell_format_dict: CellFormat = {
+            field: (value if convert is None else convert(value))
+            for name, field, convert in CELL_FORMAT_FIELDS
+            if (value := args[name]) is not None
+        }  # type: ignore
 
-        if number_format is not None:
-            cell_format_dict["numberFormat"] = number_format
+        # an empty textFormat would overwrite the extant text format with nothing
+        if len(text_format):
+            cell_format_dict = {"textFormat": text_format, **cell_format_dict}  # type: ignore
 
         if cell_format is not None:
             cell_format_dict.update(cell_format)
 
-        return {"textFormat": text_format, **cell_format_dict}  # type: ignore
+        return cell_format_dict
 
     # TODO! fix hyperlink formatting update - does not preserve extant hyperlinks
     def format(
@@ -1735,28 +2553,62 @@ class Sheets(DriveBase):
             ),
         )
 
-        def resize_and_create_request(sheet_id: int, sheet_slice: SheetSliceT):
-            rows, cols = sheet_slice.rows, sheet_slice.columns
+        # when updating, an empty cell format would emit no-op repeatCell requests; only the dimensions are resized
+        has_cell_format = any(k != "textFormat" or v for k, v in cell_format.items())
+        has_sizes = (
+            sheets_format.column_sizes is not None or sheets_format.row_sizes is not None
+        )
+        # nothing to merge nor resize: skip the sheet lookups and the batch update entirely
+        if not has_cell_format and not has_sizes and update:
+            return None
 
-            if sheets_format.column_sizes is not None:
-                # if overflow is enabled, don't resize the columns:
-                if not (cell_format.get("wrapStrategy") == WrapStrategy.OVERFLOW_CELL):
-                    self.resize_dimensions(
-                        spreadsheet_id=spreadsheet_id,
-                        sheet_name=sheet_slice.sheet_name,
-                        sizes=sheets_format.column_sizes,
-                        dimension=SheetsDimension.columns,
-                    )
+        wrap_strategy_value = cell_format.get("wrapStrategy")
+        # sizes apply to the whole sheet, so each sheet is only resized once
+        resized_sheet_ids: set[int] = set()
 
-            if sheets_format.row_sizes is not None:
-                # if wrapping is enabled, don't resize the rows
-                if not (cell_format.get("wrapStrategy") == WrapStrategy.WRAP):
-                    self.resize_dimensions(
-                        spreadsheet_id=spreadsheet_id,
-                        sheet_name=sheet_slice.sheet_name,
-                        sizes=sheets_format.row_sizes,
-                        dimension=SheetsDimension.rows,
-                    )
+        def resize_request(sheet_id: int, shape: tuple[int, int]) -> list[Request]:
+            if sheet_id in resized_sheet_ids:
+                return []
+            resized_sheet_ids.add(sheet_id)
+
+            sheet: Sheet = {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "gridProperties": {"rowCount": shape[0], "columnCount": shape[1]},
+                }
+            }
+            requests: list[Request] = []
+
+            # if overflow is enabled, don't resize the columns:
+            if (
+                sheets_format.column_sizes is not None
+                and wrap_strategy_value != WrapStrategy.OVERFLOW_CELL.value
+            ):
+                requests += self._resize_dimension(
+                    sheet=sheet,
+                    sizes=sheets_format.column_sizes,
+                    dimension=SheetsDimension.columns,
+                )
+
+            # if wrapping is enabled, don't resize the rows
+            if (
+                sheets_format.row_sizes is not None
+                and wrap_strategy_value != WrapStrategy.WRAP.value
+            ):
+                requests += self._resize_dimension(
+                    sheet=sheet,
+                    sizes=sheets_format.row_sizes,
+                    dimension=SheetsDimension.rows,
+                )
+
+            return requests
+
+        def create_request(sheet_id: int, sheet_slice: SheetSliceT, whole_sheet: bool):
+            rows, cols = sheet_slice.rows, sheet_slice.columns
+
+            # merging an empty format is a no-op; otherwise it clears the range's formats
+            if not has_cell_format and update:
+                return []
 
             formats = [
                 self._create_format_body(
@@ -1772,6 +2624,17 @@ class Sheets(DriveBase):
             if not update:
                 return formats
 
+            # merge with the extant formats server-side: a single request, masked to only
+            # the leaves of the new format, rather than reading back every cell
+            if whole_sheet:
+                fields = self._format_fields(cell_format)  # type: ignore
+
+                if not len(fields):
+                    return []
+
+                formats[0]["repeatCell"]["fields"] = ",".join(fields)  # type: ignore
+                return formats
+
             t_sheets_formats = self.get_format(
                 spreadsheet_id=spreadsheet_id,
                 range_name=sheet_slice,
@@ -1780,32 +2643,78 @@ class Sheets(DriveBase):
             if not len(t_sheets_formats) or t_sheets_formats[0].cell_formats is None:
                 return formats
 
-            formats = []
             cell_formats = t_sheets_formats[0].cell_formats
 
-            for n in range(rows.start - 1, rows.stop):
-                for m in range(cols.start - 1, cols.stop):
-                    format = None
+            # Intern every distinct extant format, so each is merged with the new format only once;
+            # cells are then keyed by their merged format. Cells outside of the extant formats take
+            # the new format as-is.
+            base_key = json.dumps(cell_format, sort_keys=True)
+
+            merged_keys: dict[str, str] = {}
+            merged_formats: dict[str, CellFormat] = {base_key: cell_format}
+
+            def merged_format_key(n: int, m: int) -> str:
+                if n >= len(cell_formats) or m >= len(cell_formats[n]):
+                    return base_key
+
+                t_cell_format = cell_formats[n][m]
+                # no extant format: the new format applies as-is
+                if not t_cell_format:
+                    return base_key
+
+                key = json.dumps(t_cell_format, sort_keys=True)
+                if key == base_key:
+                    return base_key
+
+                if key not in merged_keys:
+                    # shallow merge; only nested formats present on both sides are deep-merged
+                    merged_format = {**t_cell_format, **cell_format}
+                    for k, v in cell_format.items():
+                        if isinstance(v, dict) and isinstance(t_cell_format.get(k), dict):
+                            merged_format[k] = deep_update(
+                                copy.deepcopy(t_cell_format[k]), v  # type: ignore
+                            )
 
-                    if n < len(cell_formats) and m < len(cell_formats[n]):
-                        format = cell_formats[n][m]
+                    merged_keys[key] = t_key = json.dumps(merged_format, sort_keys=True)
+                    merged_formats.setdefault(t_key, merged_format)  # type: ignore
 
-                        t_cell_format = cell_format.copy()
+                return merged_keys[key]
 
-                        deep_update(format, t_cell_format)  # type: ignore
+            # Run-length encode each row into spans of identically formatted cells;
+            # identical consecutive rows are folded into the previous row's rectangles.
+            formats = []
+            prev_runs: list[tuple[int, int, str]] = []
+            prev_formats: list[Request] = []
+
+            for n in range(rows.start, rows.stop + 1):
+                runs: list[tuple[int, int, str]] = []
+
+                for m in range(cols.start, cols.stop + 1):
+                    key = merged_format_key(n - rows.start, m - cols.start)
+
+                    if len(runs) and runs[-1][2] == key:
+                        runs[-1] = (runs[-1][0], m, key)
                     else:
-                        format = cell_format
-
-                    formats.append(
-                        self._create_format_body(
-                            sheet_id,
-                            start_row=n + 1,
-                            end_row=n + 1,
-                            start_col=m + 1,
-                            end_col=m + 1,
-                            cell_format=format,
-                        )
+                        runs.append((m, m, key))
+
+                if runs == prev_runs:
+                    for t_format in prev_formats:
+                        t_format["repeatCell"]["range"]["endRowIndex"] = n  # type: ignore
+                    continue
+
+                prev_runs = runs
+                prev_formats = [
+                    self._create_format_body(
+                        sheet_id,
+                        start_row=n,
+                        end_row=n,
+                        start_col=start_col,
+                        end_col=end_col,
+                        cell_format=merged_formats[key],
                     )
+                    for start_col, end_col, key in runs
+                ]
+                formats.extend(prev_formats)
 
             return formats
 
@@ -1817,19 +2726,47 @@ class Sheets(DriveBase):
                 spreadsheet_id=spreadsheet_id, sheet_name=sheet_slice.sheet_name
             )
 
+            # a fully bounded range, e.g. Sheet1!A1:Z100, needs no shape to be resolved;
+            # the shape's only then fetched if the dimensions are to be resized
+            bounded = (
+                sheet_slice.rows.stop is not ... and sheet_slice.columns.stop is not ...
+            )
+            if bounded and not has_sizes:
+                requests.extend(
+                    create_request(
+                        sheet_id=sheet_id, sheet_slice=sheet_slice, whole_sheet=False
+                    )
+                )
+                continue
+
             shape = self.shape(
                 spreadsheet_id=spreadsheet_id, sheet_name=sheet_slice.sheet_name
             )
 
             sheet_slice = sheet_slice.with_shape(shape)
+            rows, cols = sheet_slice.rows, sheet_slice.columns
+
+            whole_sheet = (rows.start, rows.stop, cols.start, cols.stop) == (
+                1,
+                shape[0],
+                1,
+                shape[1],
+            )
 
+            # the dimensions are resized within the same batch update as the formatting
+            requests.extend(resize_request(sheet_id=sheet_id, shape=shape))
             requests.extend(
-                resize_and_create_request(sheet_id=sheet_id, sheet_slice=sheet_slice)
+                create_request(
+                    sheet_id=sheet_id, sheet_slice=sheet_slice, whole_sheet=whole_sheet
+                )
             )
 
+        if not len(requests):
+            return None
+
         body: BatchUpdateSpreadsheetRequest = {"requests": requests}
 
-        self.batch_update_spreadsheet(
+        self._queue_batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )
@@ -1912,16 +2849,30 @@ class Sheets(DriveBase):
             name=sheet_slice.sheet_name,
             include_grid_data=True,
             ranges=range_name,
+            # only the formats and dimension sizes are read, not the cell values
+            fields="sheets(properties(sheetId,title),data(rowMetadata.pixelSize,columnMetadata.pixelSize,rowData.values(effectiveFormat,userEnteredFormat)))",
         )
 
         sheets_formats = []
 
-        for data in response["data"]:
-            column_metadata = data["columnMetadata"]
-            row_metadata = data["rowMetadata"]
+        # Identical formats are destructured once; each cell gets its own copy
+        interned: dict[str, CellFormat | None] = {}
+
+        def intern_format(cell_data: CellData) -> CellFormat | None:
+            if "effectiveFormat" not in cell_data or "userEnteredFormat" not in cell_data:
+                return None
 
-            column_sizes = [metadata["pixelSize"] for metadata in column_metadata]
-            row_sizes = [metadata["pixelSize"] for metadata in row_metadata]
+            key = json.dumps(cell_data["effectiveFormat"], sort_keys=True)
+            if key not in interned:
+                interned[key] = self._destructure_row_format_data(cell_data)
+
+            return copy.deepcopy(interned[key])
+
+        pixel_size = operator.itemgetter("pixelSize")
+
+        for data in response["data"]:
+            column_sizes = list(map(pixel_size, data["columnMetadata"]))
+            row_sizes = list(map(pixel_size, data["rowMetadata"]))
 
             # Row data may be missing if the sheet is empty
             if "rowData" not in data:
@@ -1944,9 +2895,7 @@ class Sheets(DriveBase):
                 row_formats: list[CellFormat] = []
 
                 for value in row["values"]:
-                    if (
-                        t_cell_format := self._destructure_row_format_data(value)
-                    ) is not None:
+                    if (t_cell_format := intern_format(value)) is not None:
                         row_formats.append(t_cell_format)
 
                 cell_formats.append(row_formats)
@@ -1993,39 +2942,45 @@ class Sheets(DriveBase):
         dtypes = dtypes if dtypes is not None else {}
 
         def convert_dtypes(df: pd.DataFrame) -> pd.DataFrame:
-            for col, dtype in dtypes.items():
-                df[col] = df[col].astype(dtype)
-
-            return df
+            # a single astype over every column, rather than one per column
+            return df.astype(dtypes) if len(dtypes) else df
 
         # No values
         if not len(rows := values.get("values", [])):
             return pd.DataFrame()
 
-        columns = columns if columns is not None else []
-        # if we have extant columns, append to them instead of replacing them
-        columns += rows[0]  # type: ignore
+        # if we have extant columns, append to them instead of replacing them;
+        # the caller's list is left as-is
+        columns = [*(columns if columns is not None else []), *rows[0]]
 
         rows = rows[1:] if len(rows) > 1 else []  # type: ignore
 
-        df = pd.DataFrame(rows, **kwargs)
-
         # Only headers
-        if not len(df) and len(columns):
+        if not len(rows):
             df = pd.DataFrame(columns=columns, **kwargs)
-            convert_dtypes(df)
-            return df
-
-        mapper = {i: col for i, col in enumerate(columns)}
-        df.rename(columns=mapper, inplace=True)
+            return convert_dtypes(df)
+
+        # Name the columns at construction; any past the header keep their positional label
+        width = max(map(len, rows))
+        df = pd.DataFrame(
+            rows,
+            columns=[columns[i] if i < len(columns) else i for i in range(width)],
+            **kwargs,
+        )
 
         df = df.convert_dtypes()
         # Set object columns to pd.StringDtype:
         df = df.astype({col: pd.StringDtype() for col in df.select_dtypes("object")})
-        # Replace empty strings with pd.NA; infer the data types
-        df.select_dtypes(include=["object", "string"]).replace(
-            r"^\s*$", pd.NA, regex=True, inplace=True
-        )
+        # Replace blank strings with pd.NA via a vectorized mask
+        for i, dtype in enumerate(df.dtypes):
+            if not pd.api.types.is_string_dtype(dtype):
+                continue
+
+            col = df.iloc[:, i].astype("string")
+            blank = col.str.strip().eq("").fillna(False).astype(bool)
+            if blank.any():
+                df.isetitem(i, col.mask(blank, pd.NA))
+
         df = convert_dtypes(df)
 
         return df
@@ -2042,15 +2997,13 @@ class Sheets(DriveBase):
             df (pd.DataFrame): The DataFrame to convert.
             as_dict (bool, optional): Whether to return a list of dicts instead of a list of lists. Defaults to False.
         """
-        t_df = df.astype(str)
-        t_df[df.isna()] = ""
-
-        df = t_df
+        # single pass to the string dtype; missing values become ""
+        df = df.astype("string").fillna("")
 
         if as_dict:
             return df.to_dict(orient="records")
 
-        data: list = df.values.tolist()  # type: ignore
+        data: list = df.to_numpy(dtype=object).tolist()
         data.insert(0, list(df.columns))
         return data
 
@@ -2070,31 +3023,38 @@ class Sheets(DriveBase):
         """
         sheet_id = sheet["properties"]["sheetId"]
         grid_properties = sheet["properties"]["gridProperties"]
-        count = (
-            grid_properties["columnCount"]
-            if dimension == SheetsDimension.columns
-            else grid_properties["rowCount"]
-        )
+        count = grid_properties[
+            "columnCount" if dimension is SheetsDimension.columns else "rowCount"
+        ]
 
-        # Helper to create dimension range
-        def make_range(start: int, end: int | None = None) -> dict:
-            return {
-                "sheetId": sheet_id,
-                "dimension": dimension.value,
-                "startIndex": start,
-                "endIndex": end if end is not None else start + 1,
-            }
+        dimension_value = dimension.value
 
         # Case 1: Auto-resize all
         if sizes is None:
-            return [{"autoResizeDimensions": {"dimensions": make_range(0, count)}}]
+            return [
+                {
+                    "autoResizeDimensions": {
+                        "dimensions": {
+                            "sheetId": sheet_id,
+                            "dimension": dimension_value,
+                            "startIndex": 0,
+                            "endIndex": count,
+                        }
+                    }
+                }
+            ]
 
         # Case 2: Single size for all
         if isinstance(sizes, int):
             return [
                 {
                     "updateDimensionProperties": {
-                        "range": make_range(0, count),
+                        "range": {
+                            "sheetId": sheet_id,
+                            "dimension": dimension_value,
+                            "startIndex": 0,
+                            "endIndex": count,
+                        },
                         "properties": {"pixelSize": sizes},
                         "fields": "pixelSize",
                     }
@@ -2102,33 +3062,42 @@ class Sheets(DriveBase):
             ]
 
         # Case 3: List of sizes with possible None values
-        requests: list = []
-
-        # Group consecutive None values for batch auto-resize
+        # Group runs of equal sizes into a single request; runs of None are auto-resized
+        runs: list[tuple[int | None, int, int]] = []
         i = 0
-        while i < min(len(sizes), count):
-            if sizes[i] is None:
-                # Find end of None sequence
-                j = i + 1
-                while j < min(len(sizes), count) and sizes[j] is None:
-                    j += 1
-                requests.append(
-                    {"autoResizeDimensions": {"dimensions": make_range(i, j)}}
-                )
-                i = j
-            else:
-                requests.append(
-                    {
-                        "updateDimensionProperties": {
-                            "range": make_range(i),
-                            "properties": {"pixelSize": sizes[i]},
-                            "fields": "pixelSize",  # type: ignore
+        for size, group in itertools.groupby(itertools.islice(sizes, count)):
+            j = i + sum(1 for _ in group)
+            runs.append((size, i, j))
+            i = j
+
+        return [
+            (
+                {
+                    "autoResizeDimensions": {
+                        "dimensions": {
+                            "sheetId": sheet_id,
+                            "dimension": dimension_value,
+                            "startIndex": i,
+                            "endIndex": j,
                         }
                     }
-                )
-                i += 1
-
-        return requests
+                }
+                if size is None
+                else {
+                    "updateDimensionProperties": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "dimension": dimension_value,
+                            "startIndex": i,
+                            "endIndex": j,
+                        },
+                        "properties": {"pixelSize": size},
+                        "fields": "pixelSize",
+                    }
+                }
+            )
+            for size, i, j in runs
+        ]
 
     def resize_dimensions(
         self,
@@ -2151,7 +3120,7 @@ class Sheets(DriveBase):
         spreadsheet_id = parse_file_id(spreadsheet_id)
         sheet_slice = to_sheet_slice(sheet_name)
         sheet_name = sheet_slice.sheet_name
-        sheet = self.get(spreadsheet_id, name=sheet_name)
+        sheet = self._get_sheet(spreadsheet_id, sheet_name)
 
         # Create and execute resize request
         body: BatchUpdateSpreadsheetRequest = {
@@ -2162,7 +3131,7 @@ class Sheets(DriveBase):
             )
         }
 
-        return self.batch_update_spreadsheet(
+        return self._queue_batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )  # type: ignore
@@ -2173,40 +3142,103 @@ class Sheets(DriveBase):
         sheet_name: str = DEFAULT_SHEET_NAME,
         rows: int = 0,
         columns: int = 0,
+        sheet_id: int | None = None,
     ):
         """Freezes rows and/or columns in a sheet.
 
+        If the sheet is already frozen as requested, no update is made.
+
         Args:
             spreadsheet_id (str): The ID of the spreadsheet
             sheet_name (str, optional): Name of the sheet to freeze. Defaults to DEFAULT_SHEET_NAME.
             rows (int, optional): Number of rows to freeze from top. Defaults to 0.
             columns (int, optional): Number of columns to freeze from left. Defaults to 0.
+            sheet_id (int, optional): The ID of the sheet to freeze; if provided, the sheet's metadata isn't looked up
+                and the update is always made. Defaults to None.
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
-        sheet_id = self.id(spreadsheet_id, sheet_name)
+
+        if sheet_id is None:
+            sheet_name = to_sheet_slice(sheet_name).sheet_name
+            sheet = self._get_sheet(spreadsheet_id, sheet_name)
+
+            # nothing to do if the sheet is already frozen as such
+            if self._is_frozen(sheet, rows=rows, columns=columns):
+                return None
+
+            sheet_id = sheet["properties"]["sheetId"]
 
         body: BatchUpdateSpreadsheetRequest = {
-            "requests": [
-                {
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id,
-                            "gridProperties": {
-                                "frozenRowCount": rows,
-                                "frozenColumnCount": columns,
-                            },
-                        },
-                        "fields": "gridProperties.frozenRowCount,gridProperties.frozenColumnCount",
-                    }
-                }
-            ]
+            "requests": [self._freeze_request(sheet_id, rows=rows, columns=columns)]
         }
 
-        return self.batch_update_spreadsheet(
+        return self._queue_batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
             body=body,
         )
 
+    @staticmethod
+    def _freeze_request(sheet_id: int, rows: int = 0, columns: int = 0) -> Request:
+        return {
+            "updateSheetProperties": {
+                "properties": {
+                    "sheetId": sheet_id,
+                    "gridProperties": {
+                        "frozenRowCount": rows,
+                        "frozenColumnCount": columns,
+                    },
+                },
+                "fields": "gridProperties.frozenRowCount,gridProperties.frozenColumnCount",
+            }
+        }
+
+    @staticmethod
+    def _is_frozen(sheet: Sheet, rows: int = 0, columns: int = 0) -> bool:
+        grid_properties = sheet["properties"].get("gridProperties", {})
+
+        return (
+            grid_properties.get("frozenRowCount", 0),
+            grid_properties.get("frozenColumnCount", 0),
+        ) == (rows, columns)
+
+    @staticmethod
+    def _format_header_requests(sheet: Sheet, auto_resize: bool = False) -> list[Request]:
+        """Creates the requests to freeze and bold the header row of a sheet, with optional
+        column auto-resizing. The header format is merged into any extant format."""
+        sheet_id = sheet["properties"]["sheetId"]
+        cols = sheet["properties"]["gridProperties"]["columnCount"]
+
+        cell_format = Sheets._create_cell_format(
+            bold=True, wrap_strategy=WrapStrategy.WRAP
+        )
+
+        requests: list[Request] = []
+
+        # skip freezing if the header's already frozen
+        if not Sheets._is_frozen(sheet, rows=1):
+            requests.append(Sheets._freeze_request(sheet_id, rows=1))
+
+        requests.append(
+            Sheets._create_format_body(
+                sheet_id,
+                start_row=1,
+                end_row=1,
+                start_col=1,
+                end_col=cols,
+                cell_format=cell_format,
+                fields=",".join(Sheets._format_fields(cell_format)),  # type: ignore
+            )
+        )
+
+        if auto_resize:
+            requests += Sheets._resize_dimension(
+                sheet=sheet,
+                sizes=None,
+                dimension=SheetsDimension.columns,
+            )
+
+        return requests
+
     def format_header(
         self,
         spreadsheet_id: str,
@@ -2218,31 +3250,85 @@ class Sheets(DriveBase):
         Args:
             spreadsheet_id (str): The ID of the spreadsheet to format
             sheet_name (str, optional): Name of the sheet to format. Defaults to DEFAULT_SHEET_NAME.
-            auto_resize (bool, optional): Whether to auto-resize columns. Defaults to True.
+            auto_resize (bool, optional): Whether to auto-resize columns. Defaults to False.
         """
         spreadsheet_id = parse_file_id(spreadsheet_id)
+        sheet_name = to_sheet_slice(sheet_name).sheet_name
+        sheet = self._get_sheet(spreadsheet_id, sheet_name)
+
+        # Freeze and bold the first row, then auto-resize the columns; all in one batch update
+        body: BatchUpdateSpreadsheetRequest = {
+            "requests": self._format_header_requests(sheet=sheet, auto_resize=auto_resize)
+        }
 
-        # Freeze first row
-        self.freeze(
+        return self._queue_batch_update_spreadsheet(
             spreadsheet_id=spreadsheet_id,
-            sheet_name=sheet_name,
-            rows=1,
+            body=body,
         )
 
-        # Format first row bold
-        sheet_slice = SheetSlice[sheet_name, 1, ...]
-        self.format(
-            spreadsheet_id=spreadsheet_id,
-            range_names=sheet_slice,
-            bold=True,
-            wrap_strategy=WrapStrategy.WRAP,
+    def format_headers(
+        self,
+        spreadsheet_id: str,
+        sheet_names: list[str] | None = None,
+        auto_resize: bool = False,
+    ):
+        """Formats the header rows of several sheets at once; see `format_header`.
+
+        The spreadsheet's metadata is fetched once, and all of the sheets are formatted in a single batch update.
+
+        Args:
+            spreadsheet_id (str): The ID of the spreadsheet to format
+            sheet_names (list[str], optional): Names of the sheets to format. Defaults to None, for all sheets.
+            auto_resize (bool, optional): Whether to auto-resize columns. Defaults to False.
+        """
+        spreadsheet_id = parse_file_id(spreadsheet_id)
+
+        spreadsheet = self.get_spreadsheet(
+            spreadsheet_id, fields="sheets.properties", cache=True
         )
+        sheets = {sheet["properties"]["title"]: sheet for sheet in spreadsheet["sheets"]}
 
-        # Auto-resize columns if requested
-        if auto_resize:
-            self.resize_dimensions(
-                spreadsheet_id=spreadsheet_id,
-                sheet_name=sheet_name,
-                sizes=None,
-                dimension=SheetsDimension.columns,
+        if sheet_names is None:
+            sheet_names = list(sheets.keys())
+
+        requests: list[Request] = []
+        for sheet_name in sheet_names:
+            title = self._sheet_title(to_sheet_slice(sheet_name).sheet_name)
+            if title not in sheets:
+                raise ValueError(f"Sheet {sheet_name} not found in spreadsheet.")
+
+            requests += self._format_header_requests(
+                sheet=sheets[title], auto_resize=auto_resize
             )
+
+        if not len(requests):
+            return None
+
+        body: BatchUpdateSpreadsheetRequest = {"requests": requests}
+
+        return self._queue_batch_update_spreadsheet(
+            spreadsheet_id=spreadsheet_id,
+            body=body,
+        )
+
+    async def aget_spreadsheet(self, *args: Any, **kwargs: Any) -> Spreadsheet:
+        """Asynchronous `get_spreadsheet`."""
+        return await self._run_async(self.get_spreadsheet, *args, **kwargs)
+
+    async def abatch_update_spreadsheet(
+        self, *args: Any, **kwargs: Any
+    ) -> BatchUpdateSpreadsheetResponse:
+        """Asynchronous `batch_update_spreadsheet`."""
+        return await self._run_async(self.batch_update_spreadsheet, *args, **kwargs)
+
+    async def avalues(self, *args: Any, **kwargs: Any) -> ValueRange:
+        """Asynchronous `values`."""
+        return await self._run_async(self.values, *args, **kwargs)
+
+    async def aupdate(self, *args: Any, **kwargs: Any) -> UpdateValuesResponse | None:
+        """Asynchronous `update`."""
+        return await self._run_async(self.update, *args, **kwargs)
+
+    async def aappend(self, *args: Any, **kwargs: Any) -> AppendValuesResponse | None:
+        """Asynchronous `append`."""
+        return await self._run_async(self.append, *args, **kwargs)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+import threading
 from typing import *
 
-from cachetools import cached
+from cachetools import LRUCache, cached
 
 from googleapiutils2.sheets.misc import (
     INIT_SHEET_SHAPE,
     SheetSliceT,
-    split_sheet_range,
 )
 
 SheetSlice = SheetSliceT()
@@ -15,18 +15,18 @@ SheetSlice = SheetSliceT()
 SheetsRange = str | SheetSliceT | Hashable
 
 
-cache: dict[SheetSliceT, SheetSliceT] = {}
+cache: LRUCache[Hashable, SheetSliceT] = LRUCache(maxsize=4096)
+# ranges are converted from several threads at once, e.g. by the async worker pool
+cache_lock = threading.Lock()
 
 
-def sheets_rangekey(sheets_range: SheetsRange) -> SheetSliceT:
-    if isinstance(sheets_range, str):
-        sheet_name, range_name = split_sheet_range(sheets_range)
-        return SheetSliceT(sheet_name=sheet_name, range_name=range_name)
-    else:
-        return sheets_range  # type: ignore
+def sheets_rangekey(sheets_range: SheetsRange) -> Hashable:
+    # Strings are their own key: building a SheetSliceT here would parse the
+    # A1 range on every call, cache hit or not
+    return sheets_range
 
 
-@cached(cache=cache, key=sheets_rangekey)
+@cached(cache=cache, key=sheets_rangekey, lock=cache_lock)
 def to_sheet_slice(sheets_range: SheetsRange) -> SheetSliceT:
     """Convert a string range to a SheetSlice. See the SheetSliceT class for more details."""
 
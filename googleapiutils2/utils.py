@@ -14,8 +14,9 @@ import socket
 import time
 import urllib.parse
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from functools import cache, wraps
+from functools import cache, lru_cache, wraps
 from mimetypes import guess_type
 from pathlib import Path
 from queue import Empty, Queue
@@ -24,15 +25,23 @@ import threading
 from typing import *
 
 import googleapiclient.http
+import httplib2
 import requests
-from cachetools import TTLCache
+from cachetools import TLRUCache
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.model import JsonModel
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 if TYPE_CHECKING:
     from googleapiclient._apis.drive.v3.resources import File
@@ -51,6 +60,23 @@ EXECUTE_TIME = 0.1
 
 THROTTLE_TIME = 1
 
+MAX_ASYNC_WORKERS = 16
+
+# Maximum number of entries held by each API wrapper's cache
+CACHE_MAXSIZE = 4096
+# Time to live, in seconds, of cached entries by the name of the cached method;
+# headers change most often after writes, so they expire sooner, shapes and sheet metadata
+# can change from outside of this client, whereas a sheet's ID is fixed for its lifetime
+CACHE_TTLS: dict[str, float] = {
+    "header": 30,
+    "shape": 60,
+    "sheet": 60,
+    "spreadsheet": 60,
+    "id": 3600,
+    "sheet_id": 3600,
+}
+CACHE_TTL = 300
+
 
 SCOPES = [
     # Google Drive API
@@ -292,10 +318,28 @@ def raise_for_status(status: str) -> None:
         raise GoogleAPIException("An unexpected error occurred.")
 
 
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+
 def on_http_exception(e: Exception) -> bool:
+    """Whether an exception is transient, and so the request should be retried:
+    rate limiting (429, or 403 with a rate limit reason) or unavailability (503)."""
     if isinstance(e, googleapiclient.errors.HttpError):  # type: ignore
         status = e.resp.status  # type: ignore
-        return status == http.HTTPStatus.TOO_MANY_REQUESTS
+
+        if status in (
+            http.HTTPStatus.TOO_MANY_REQUESTS,
+            http.HTTPStatus.SERVICE_UNAVAILABLE,
+        ):
+            return True
+
+        if status == http.HTTPStatus.FORBIDDEN:
+            details = e.error_details if isinstance(e.error_details, list) else []  # type: ignore
+            return any(
+                isinstance(detail, dict) and detail.get("reason") in RATE_LIMIT_REASONS
+                for detail in details
+            )
+
     return False
 
 
@@ -396,6 +440,46 @@ class Throttler:
         return dt
 
 
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Up to `burst` calls may proceed at once, after which tokens are refilled at `rate` per second;
+    callers wait for a token *before* a quota would be exceeded, rather than backing off afterwards.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._prev_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token, returning the time to wait until it's available."""
+        with self._lock:
+            now = time.monotonic()
+
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._prev_time) * self._rate
+            )
+            self._prev_time = now
+            self._tokens -= 1
+
+            return max(0, -self._tokens / self._rate)
+
+    def acquire(self) -> float:
+        if self._rate <= 0:
+            return 0
+
+        dt = self._reserve()
+
+        if dt > 0:
+            logger.debug(f"Rate limiting for {dt:.2f} seconds")
+            time.sleep(dt)
+
+        return dt
+
+
 class DriveThread:
     """Handles threaded execution of Google Drive API requests."""
 
@@ -490,6 +574,51 @@ class DriveThread:
         self._request_thread.join()
 
 
+class FastJsonModel(JsonModel):
+    """JsonModel that serializes request bodies, and deserializes response bodies, with orjson,
+    if it's installed (the optional `orjson` extra).
+
+    The body is emitted as UTF-8 bytes, which the transport sends as-is; responses are parsed
+    straight from the raw bytes.
+    Falls back to the stdlib `json` (de)serialization otherwise.
+
+    The two differ for some request bodies:
+        - NaN and infinite floats are written as `null` by orjson, but as the invalid
+            `NaN`/`Infinity` tokens by `json`, which the API rejects.
+        - Non-str keys (e.g. datetimes, enums) are stringified by orjson; `json` only
+            stringifies int, float, bool, and None keys, raising on any other.
+        - datetimes, dataclasses, and UUIDs are serialized natively by orjson; `json` raises.
+    """
+
+    def serialize(self, body_value):
+        if orjson is None:
+            return super().serialize(body_value)
+
+        if (
+            isinstance(body_value, dict)
+            and "data" not in body_value
+            and self._data_wrapper
+        ):
+            body_value = {"data": body_value}
+
+        return orjson.dumps(body_value, option=orjson.OPT_NON_STR_KEYS)
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # not JSON: the stdlib path returns the content as-is
+            return super().deserialize(content)
+
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+
+        return body
+
+
 class DriveBase:
     """Base class for Google Drive API operations with throttling and request queueing."""
 
@@ -504,14 +633,50 @@ class DriveBase:
 
         # Create throttlers for different operations
         self._execute_throttler = Throttler(execute_time)
+        # Optional rate limiter for write (non-GET) requests, set by APIs with write quotas
+        self._write_limiter: TokenBucket | None = None
         self._execute_queue_throttler = Throttler(throttle_time)
 
-        # TTL cache for various functions
-        self._cache: TTLCache = TTLCache(maxsize=128, ttl=80)
+        # TTL cache for various functions, with per-method TTLs; guarded by `_cache_lock`,
+        # as requests may be issued from several threads
+        self._cache: TLRUCache = TLRUCache(maxsize=CACHE_MAXSIZE, ttu=cache_ttu)
+        self._cache_lock = threading.RLock()
+
+        # Per-thread authorized transports; see `_get_http`
+        self._thread_local = threading.local()
+
+        # Worker pool for asynchronous execution; created on first use, and shut down by `close`
+        self._async_executor_pool: ThreadPoolExecutor | None = None
+        self._async_executor_lock = threading.Lock()
 
         # Initialize drive thread
         self._drive_thread = DriveThread(worker_func=self.execute)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the asynchronous worker pool, if it was started; it's recreated if used again."""
+        with self._async_executor_lock:
+            executor, self._async_executor_pool = self._async_executor_pool, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @property
+    def _async_executor(self) -> ThreadPoolExecutor:
+        """The worker pool for asynchronous execution, created on first use."""
+        with self._async_executor_lock:
+            if self._async_executor_pool is None:
+                self._async_executor_pool = ThreadPoolExecutor(
+                    max_workers=MAX_ASYNC_WORKERS
+                )
+
+            return self._async_executor_pool
+
     @retry(
         retries=10,
         delay=30.0,
@@ -522,34 +687,98 @@ class DriveBase:
         """Execute a request with retry and throttling."""
         self._execute_throttler.throttle()
 
-        return request.execute(num_retries=1)
+        if self._write_limiter is not None and request.method != "GET":
+            self._write_limiter.acquire()
+
+        return request.execute(http=self._get_http(request), num_retries=1)
+
+    async def _run_async(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a blocking call on the worker pool, so that up to MAX_ASYNC_WORKERS requests may be in flight
+        at once; each worker keeps its own connection (see `_get_http`)."""
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._async_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def aexecute(self, request: googleapiclient.http.HttpRequest) -> Any:
+        """Asynchronous `execute`."""
+        return await self._run_async(self.execute, request)
+
+    def _get_http(
+        self, request: googleapiclient.http.HttpRequest
+    ) -> AuthorizedHttp | Any:
+        """Returns the calling thread's copy of the request's authorized transport.
+
+        httplib2.Http isn't thread-safe, so rather than sharing the service's transport
+        between the caller and the queue worker, each thread lazily creates its own,
+        which then keeps its connections alive across requests.
+        Each copy keeps the service's credentials, timeout, proxy, and TLS settings;
+        transports other than an `AuthorizedHttp` over an httplib2.Http are used as-is.
+        Copies are also rebuilt after a fork, as a child must not share its parent's sockets.
+        """
+        base = request.http
+        if not isinstance(base, AuthorizedHttp) or not isinstance(
+            base.http, httplib2.Http
+        ):
+            return base
+
+        pid = os.getpid()
+        if getattr(self._thread_local, "pid", None) != pid:
+            self._thread_local.https = {}
+            self._thread_local.pid = pid
+
+        # keyed by the service's transport, as an instance may hold several services
+        https: dict[int, AuthorizedHttp] = self._thread_local.https
+        http = https.get(id(base))
+
+        if http is None:
+            inner = base.http
+            copy = httplib2.Http(
+                timeout=inner.timeout,
+                proxy_info=inner.proxy_info,
+                ca_certs=inner.ca_certs,
+                disable_ssl_certificate_validation=inner.disable_ssl_certificate_validation,
+                tls_maximum_version=inner.tls_maximum_version,
+                tls_minimum_version=inner.tls_minimum_version,
+            )
+            # e.g. build_http's, which excludes 308 so resumable uploads may continue
+            copy.redirect_codes = inner.redirect_codes
+            copy.follow_redirects = inner.follow_redirects
+
+            http = https[id(base)] = AuthorizedHttp(base.credentials, http=copy)
+
+        return http
 
     def execute_queue(self, request: googleapiclient.http.HttpRequest) -> None:
         """Add a request to the execution queue."""
         self._drive_thread.enqueue(request)
 
 
+def cache_ttu(key: tuple, value: Any, now: float) -> float:
+    """Time-to-use for a `named_methodkey` cache entry: its expiry time, given the name of the cached method."""
+    return now + CACHE_TTLS.get(key[0], CACHE_TTL)
+
+
 def named_methodkey(name: str):
     """Hash key that ignores the first argument of a method, but is named for the method."""
 
     def _key(self, *args, **kwargs):
-        return tuple([name] + list(args) + list(kwargs.values()))
+        # built in one step, without the intermediate lists
+        return (name, *args, *kwargs.values())
 
     return _key
 
 
-def hex_to_rgb(hex_code: str) -> Color:
-    """Converts a hex color code to RGB(A), where each value is between 0 and 1.
-
-    Args:
-        hex_code (str): Hex color code to convert. Can be 3, 4, 6, or 8 characters long (optional alpha is supported).
-    """
+@lru_cache(maxsize=256)
+def _hex_to_rgb_items(hex_code: str) -> tuple[tuple[str, float], ...]:
+    # memoized as an immutable tuple; `hex_to_rgb` builds a fresh dict from it for each caller
     hex_code = hex_code.lstrip("#")
 
     if len(hex_code) == 3 or len(hex_code) == 4:
         hex_code = "".join([2 * c for c in hex_code])
 
-    rgb: Color = {
+    rgb = {
         "red": int(hex_code[:2], 16),
         "green": int(hex_code[2:4], 16),
         "blue": int(hex_code[4:6], 16),
@@ -560,7 +789,16 @@ def hex_to_rgb(hex_code: str) -> Color:
     elif len(hex_code) != 6:
         raise ValueError("Invalid hex code")
 
-    return {k: v / 255.0 for k, v in rgb.items()}  # type: ignore
+    return tuple((k, v / 255.0) for k, v in rgb.items())
+
+
+def hex_to_rgb(hex_code: str) -> Color:
+    """Converts a hex color code to RGB(A), where each value is between 0 and 1.
+
+    Args:
+        hex_code (str): Hex color code to convert. Can be 3, 4, 6, or 8 characters long (optional alpha is supported).
+    """
+    return dict(_hex_to_rgb_items(hex_code))  # type: ignore
 
 
 def get_url_params(url: str) -> dict[str, List[str]]:
@@ -755,7 +993,15 @@ def get_id_from_url(url: str) -> str:
             raise ValueError(f"Could not parse file URL of {url}")
 
 
-@cache
+@lru_cache(maxsize=4096)
+def _parse_file_id_str(file_id: str) -> str:
+    # memoized separately from `parse_file_id`, whose dict inputs are unhashable
+    if "http" in file_id:
+        return get_id_from_url(file_id)
+    else:
+        return file_id
+
+
 def parse_file_id(
     file_id: str,
 ) -> str:
@@ -781,12 +1027,9 @@ def parse_file_id(
     >>> parse_file_id({'id': '123456789'})
     '123456789'
     """
-
-    def parse(file_id: str) -> str:
-        if "http" in file_id:
-            return get_id_from_url(file_id)
-        else:
-            return file_id
+    # Common case: IDs are usually already-parsed strings
+    if isinstance(file_id, str):
+        return _parse_file_id_str(file_id)
 
     def obj_to_id(file: str) -> str:
         if isinstance(file, str):
@@ -795,7 +1038,7 @@ def parse_file_id(
             return file.get("id", file.get("spreadsheetId", None))
 
     if (id := obj_to_id(file_id)) is not None:
-        return parse(id)
+        return _parse_file_id_str(id)
     else:
         return file_id
 
@@ -0,0 +1,50 @@
+"""Fixtures for the offline tests, which run `Sheets` against `FakeSheetsAPI` rather than
+a live spreadsheet."""
+
+from __future__ import annotations
+
+from typing import *
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from googleapiutils2 import Sheets
+
+from .fake_sheets import FakeSheetsAPI
+
+
+# The session's live fixtures are overridden, so that no credentials are needed
+@pytest.fixture(scope="module", autouse=True)
+def creds():
+    return Credentials(token="offline")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def drive():
+    return None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def google_folders():
+    return {}
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_sheet():
+    return None
+
+
+@pytest.fixture
+def api() -> FakeSheetsAPI:
+    return FakeSheetsAPI()
+
+
+@pytest.fixture
+def sheets(creds: Credentials, api: FakeSheetsAPI):
+    sheets = Sheets(creds=creds)
+    sheets.execute = api.execute  # type: ignore
+    sheets._batch_update_throttler.dt = lambda: 1  # type: ignore
+
+    yield sheets
+
+    sheets.close()
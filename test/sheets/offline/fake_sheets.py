@@ -0,0 +1,172 @@
+"""An in-memory stand-in for the Sheets API, so that `Sheets` may be tested offline."""
+
+from __future__ import annotations
+
+import json
+import urllib.parse
+from typing import *
+
+from googleapiutils2.sheets.sheets_slice import to_sheet_slice
+
+SPREADSHEET_ID = "offline"
+
+
+class FakeSheetsAPI:
+    """Answers the requests given to `Sheets.execute`, keeping each sheet's properties
+    and values in memory."""
+
+    def __init__(self):
+        self.sheets: dict[int, dict[str, Any]] = {}
+        self.values: dict[int, dict[tuple[int, int], Any]] = {}
+        self.calls: list[tuple[str, str, Any]] = []
+
+        self.add_sheet("Sheet1", rows=10, cols=5)
+
+    def add_sheet(self, title: str, rows: int = 1000, cols: int = 26) -> dict[str, Any]:
+        sheet_id = max(self.sheets, default=-1) + 1
+        properties = {
+            "sheetId": sheet_id,
+            "title": title,
+            "gridProperties": {"rowCount": rows, "columnCount": cols},
+        }
+        self.sheets[sheet_id] = properties
+        self.values[sheet_id] = {}
+        return properties
+
+    def sheet_id(self, title: str) -> int:
+        title = title.strip("'")
+        for sheet_id, properties in self.sheets.items():
+            if properties["title"] == title:
+                return sheet_id
+        raise KeyError(title)
+
+    def shape(self, title: str) -> tuple[int, int]:
+        grid_properties = self.sheets[self.sheet_id(title)]["gridProperties"]
+        return grid_properties["rowCount"], grid_properties["columnCount"]
+
+    def _bounds(self, range_name: str):
+        sheet_slice = to_sheet_slice(range_name)
+        sheet_slice = sheet_slice.with_shape(self.shape(sheet_slice.sheet_name))
+        rows, cols = sheet_slice.rows, sheet_slice.columns
+
+        if rows.stop > self.shape(sheet_slice.sheet_name)[0]:
+            raise ValueError(f"Range {range_name} exceeds grid limits.")
+
+        return self.sheet_id(sheet_slice.sheet_name), rows, cols
+
+    def read(self, range_name: str) -> dict[str, Any]:
+        sheet_id, rows, cols = self._bounds(range_name)
+        cells = self.values[sheet_id]
+
+        values = []
+        for r in range(rows.start, rows.stop + 1):
+            row = [cells.get((r, c), "") for c in range(cols.start, cols.stop + 1)]
+            while len(row) and row[-1] == "":
+                row.pop()
+            values.append(row)
+
+        while len(values) and not len(values[-1]):
+            values.pop()
+
+        return {"values": values} if len(values) else {}
+
+    def write(self, range_name: str, values: list[list[Any]]):
+        sheet_id, rows, cols = self._bounds(range_name)
+
+        for n, row in enumerate(values):
+            for m, value in enumerate(row):
+                self.values[sheet_id][(rows.start + n, cols.start + m)] = value
+
+    def batch_update(self, body: dict[str, Any]) -> dict[str, Any]:
+        replies: list[dict[str, Any]] = []
+
+        for request in body["requests"]:
+            reply: dict[str, Any] = {}
+
+            if "addSheet" in request:
+                properties = request["addSheet"]["properties"]
+                grid_properties = properties.get("gridProperties", {})
+                reply["addSheet"] = {
+                    "properties": self.add_sheet(
+                        properties["title"],
+                        rows=grid_properties.get("rowCount", 1000),
+                        cols=grid_properties.get("columnCount", 26),
+                    )
+                }
+            elif "deleteSheet" in request:
+                sheet_id = request["deleteSheet"]["sheetId"]
+                del self.sheets[sheet_id], self.values[sheet_id]
+            elif "updateSheetProperties" in request:
+                properties = request["updateSheetProperties"]["properties"]
+                sheet = self.sheets[properties["sheetId"]]
+
+                if "title" in properties:
+                    sheet["title"] = properties["title"]
+                sheet["gridProperties"].update(properties.get("gridProperties", {}))
+
+            replies.append(reply)
+
+        return {"spreadsheetId": SPREADSHEET_ID, "replies": replies}
+
+    def execute(self, request: Any) -> Any:
+        method = request.methodId.removeprefix("sheets.spreadsheets.")
+        url = urllib.parse.urlparse(request.uri)
+        query = urllib.parse.parse_qs(url.query)
+        body = json.loads(request.body) if request.body else None
+
+        self.calls.append((method, request.uri, body))
+
+        if method == "create":
+            return {"spreadsheetId": SPREADSHEET_ID, **body}
+        elif method == "get":
+            sheets = [
+                {"properties": json.loads(json.dumps(properties))}
+                for properties in self.sheets.values()
+            ]
+            # formats aren't kept: only the dimension sizes are returned
+            if query.get("includeGridData") == ["true"]:
+                for sheet in sheets:
+                    rows, cols = self.shape(sheet["properties"]["title"])
+                    sheet["data"] = [
+                        {
+                            "rowMetadata": [{"pixelSize": 21}] * rows,
+                            "columnMetadata": [{"pixelSize": 100}] * cols,
+                        }
+                    ]
+            return {"sheets": sheets}
+        elif method == "batchUpdate":
+            return self.batch_update(body)
+        elif method == "values.get":
+            range_name = urllib.parse.unquote(url.path.split("/values/")[1])
+            return self.read(range_name)
+        elif method == "values.batchGet":
+            return {"valueRanges": [self.read(r) for r in query["ranges"]]}
+        elif method == "values.update":
+            range_name = urllib.parse.unquote(url.path.split("/values/")[1])
+            self.write(range_name, body["values"])
+            return {"updatedRange": range_name}
+        elif method == "values.batchUpdate":
+            for value_range in body["data"]:
+                self.write(value_range["range"], value_range["values"])
+            return {"totalUpdatedRows": len(body["data"])}
+        elif method == "values.append":
+            range_name = urllib.parse.unquote(
+                url.path.split("/values/")[1].removesuffix(":append")
+            )
+            sheet_slice = to_sheet_slice(range_name)
+            start = len(self.read(sheet_slice.sheet_name).get("values", [])) + 1
+            rows, cols = self.shape(sheet_slice.sheet_name)
+
+            grown = start + len(body["values"]) - 1
+            if grown > rows:
+                self.sheets[self.sheet_id(sheet_slice.sheet_name)]["gridProperties"][
+                    "rowCount"
+                ] = grown
+
+            self.write(f"{sheet_slice.sheet_name}!A{start}", body["values"])
+            return {"updates": {"updatedRows": len(body["values"])}}
+
+        raise NotImplementedError(method)
+
+    def count(self, method: str) -> int:
+        return sum(1 for call in self.calls if call[0] == method)
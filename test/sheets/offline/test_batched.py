@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+from typing import *
+
+import pytest
+
+from googleapiutils2 import Sheets
+
+from .fake_sheets import SPREADSHEET_ID, FakeSheetsAPI
+
+
+def test_batched_queues_requests(sheets: Sheets, api: FakeSheetsAPI):
+    with sheets.batched():
+        assert sheets.format(SPREADSHEET_ID, "Sheet1!A1:B2", bold=True) is None
+        assert sheets.freeze(SPREADSHEET_ID, "Sheet1", rows=1) is None
+        assert sheets.resize(SPREADSHEET_ID, "Sheet1", rows=20, cols=5) is None
+
+        assert api.count("batchUpdate") == 0
+
+    assert api.count("batchUpdate") == 1
+    assert len(api.calls[-1][2]["requests"]) == 3
+    assert api.shape("Sheet1") == (20, 5)
+
+
+def test_batched_resize_shape(sheets: Sheets, api: FakeSheetsAPI):
+    with sheets.batched():
+        sheets.resize(SPREADSHEET_ID, "Sheet1", rows=20, cols=5)
+
+        # the queued resize hasn't grown the grid, so the write grows it itself
+        assert sheets.shape(SPREADSHEET_ID, "'Sheet1'") == (10, 5)
+        sheets.update(SPREADSHEET_ID, "Sheet1!A15", [[1]])
+
+    assert api.read("Sheet1!A15")["values"] == [[1]]
+    assert sheets.shape(SPREADSHEET_ID, "'Sheet1'") == (20, 5)
+
+
+def test_batched_discarded(sheets: Sheets, api: FakeSheetsAPI):
+    with pytest.raises(RuntimeError):
+        with sheets.batched():
+            sheets.resize(SPREADSHEET_ID, "Sheet1", rows=20, cols=5)
+            raise RuntimeError
+
+    assert api.count("batchUpdate") == 0
+    assert sheets.shape(SPREADSHEET_ID, "'Sheet1'") == (10, 5)
+
+
+def test_batched_per_thread(sheets: Sheets, api: FakeSheetsAPI):
+    with sheets.batched():
+        thread = threading.Thread(
+            target=sheets.freeze, args=(SPREADSHEET_ID, "Sheet1"), kwargs={"rows": 1}
+        )
+        thread.start()
+        thread.join()
+
+        assert api.count("batchUpdate") == 1
+
+    assert api.count("batchUpdate") == 1
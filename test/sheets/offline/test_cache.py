@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import *
+
+import pytest
+
+from googleapiutils2 import Sheets
+
+from .fake_sheets import SPREADSHEET_ID, FakeSheetsAPI
+
+
+def test_append_resets_shape(sheets: Sheets, api: FakeSheetsAPI):
+    assert sheets.shape(SPREADSHEET_ID, "'Sheet1'") == (10, 5)
+
+    sheets.append(SPREADSHEET_ID, "Sheet1", [[n] for n in range(12)])
+
+    assert sheets.shape(SPREADSHEET_ID, "'Sheet1'") == (12, 5)
+
+
+def test_add_delete_caches(sheets: Sheets, api: FakeSheetsAPI):
+    sheets.add(SPREADSHEET_ID, "Sheet2", rows=5, cols=3)
+
+    calls = len(api.calls)
+    assert sheets.id(SPREADSHEET_ID, "Sheet2") == api.sheet_id("Sheet2")
+    assert sheets.shape(SPREADSHEET_ID, "'Sheet2'") == (5, 3)
+    assert len(api.calls) == calls
+
+    sheets.delete(SPREADSHEET_ID, "Sheet2")
+
+    assert not sheets.has(SPREADSHEET_ID, "Sheet2")
+    with pytest.raises(ValueError):
+        sheets.id(SPREADSHEET_ID, "Sheet2")
+
+
+def test_rename_caches(sheets: Sheets, api: FakeSheetsAPI):
+    sheet_id = sheets.id(SPREADSHEET_ID, "Sheet1")
+
+    sheets.rename(SPREADSHEET_ID, "'My Sheet'", name="Sheet1")
+    assert api.sheets[sheet_id]["title"] == "My Sheet"
+
+    calls = len(api.calls)
+    assert sheets.id(SPREADSHEET_ID, "My Sheet") == sheet_id
+    assert sheets.id(SPREADSHEET_ID, "'My Sheet'") == sheet_id
+    assert sheets.has(SPREADSHEET_ID, "My Sheet")
+    assert len(api.calls) == calls
+
+    assert not sheets.has(SPREADSHEET_ID, "Sheet1")
+
+
+def test_get_spreadsheet_copies(sheets: Sheets, api: FakeSheetsAPI):
+    spreadsheet = sheets.get_spreadsheet(
+        SPREADSHEET_ID, fields="sheets.properties", cache=True
+    )
+    spreadsheet["sheets"].clear()
+
+    spreadsheet = sheets.get_spreadsheet(
+        SPREADSHEET_ID, fields="sheets.properties", cache=True
+    )
+    assert len(spreadsheet["sheets"]) == 1
+    assert api.count("get") == 1
+
+    # uncached by default
+    sheets.get_spreadsheet(SPREADSHEET_ID)
+    sheets.get_spreadsheet(SPREADSHEET_ID)
+    assert api.count("get") == 3
+
+
+def test_add_external_delete(sheets: Sheets, api: FakeSheetsAPI):
+    sheets.add(SPREADSHEET_ID, "Sheet2")
+    assert sheets.has(SPREADSHEET_ID, "Sheet3") is False
+
+    # made outside of this `Sheets` object
+    api.add_sheet("Sheet3")
+
+    sheets.delete(SPREADSHEET_ID, "Sheet3")
+    assert "Sheet3" not in [p["title"] for p in api.sheets.values()]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import *
+
+from googleapiutils2 import Sheets
+
+
+def test_create_default_title(sheets: Sheets):
+    spreadsheet = sheets.create("Offline")
+
+    assert spreadsheet["properties"]["title"] == "Offline"
+    assert [sheet["properties"]["title"] for sheet in spreadsheet["sheets"]] == [
+        "Sheet1"
+    ]
+
+
+def test_create_keeps_sheet_names(sheets: Sheets):
+    body = {"sheets": [{"properties": {"title": "Old", "index": 0}}]}
+
+    spreadsheet = sheets.create("Offline", sheet_names=["'Quoted'", "Plain"], body=body)
+
+    assert [sheet["properties"] for sheet in spreadsheet["sheets"]] == [
+        {"title": "'Quoted'", "index": 0},
+        {"title": "Plain"},
+    ]
+    assert body == {"sheets": [{"properties": {"title": "Old", "index": 0}}]}
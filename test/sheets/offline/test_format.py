@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from typing import *
+
+import pytest
+
+from googleapiutils2 import (
+    HorizontalAlignment,
+    Sheets,
+    SheetsDimension,
+    SheetsFormat,
+    WrapStrategy,
+)
+
+from .fake_sheets import SPREADSHEET_ID, FakeSheetsAPI
+
+
+def repeat_cells(api: FakeSheetsAPI) -> list[dict]:
+    return [
+        request["repeatCell"]
+        for method, _, body in api.calls
+        if method == "batchUpdate"
+        for request in body["requests"]
+        if "repeatCell" in request
+    ]
+
+
+def test_format_empty_sizes(sheets: Sheets, api: FakeSheetsAPI):
+    sheets_format = SheetsFormat(column_sizes=[120] * 5)
+
+    # merging an empty format is a no-op: only the columns are resized
+    sheets.format(SPREADSHEET_ID, "Sheet1!A1:B2", sheets_format=sheets_format)
+    assert api.count("batchUpdate") == 1
+    assert repeat_cells(api) == []
+
+    # overwriting with an empty format clears the range's formats
+    sheets.format(
+        SPREADSHEET_ID, "Sheet1!A1:B2", update=False, sheets_format=sheets_format
+    )
+    (repeat_cell,) = repeat_cells(api)
+    assert repeat_cell["cell"] == {"userEnteredFormat": {}}
+    assert repeat_cell["fields"] == "userEnteredFormat"
+
+
+def test_format_empty(sheets: Sheets, api: FakeSheetsAPI):
+    # nothing to merge: no request is made
+    assert sheets.format(SPREADSHEET_ID, "Sheet1!A1:B2") is None
+    assert len(api.calls) == 0
+
+    # still clears the range's formats
+    sheets.format(SPREADSHEET_ID, "Sheet1!A1:B2", update=False)
+    (repeat_cell,) = repeat_cells(api)
+    assert repeat_cell["cell"] == {"userEnteredFormat": {}}
+    assert repeat_cell["range"] == {
+        "sheetId": 0,
+        "startRowIndex": 0,
+        "endRowIndex": 2,
+        "startColumnIndex": 0,
+        "endColumnIndex": 2,
+    }
+
+
+def test_format_headers_titles(sheets: Sheets, api: FakeSheetsAPI):
+    # titles that themselves end with a quote aren't mangled
+    sheet_id = api.add_sheet("Sheet'")["sheetId"]
+
+    sheets.format_headers(SPREADSHEET_ID, ["Sheet'"])
+
+    (repeat_cell,) = repeat_cells(api)
+    assert repeat_cell["range"]["sheetId"] == sheet_id
+    assert api.sheets[sheet_id]["gridProperties"]["frozenRowCount"] == 1
+
+
+def test_resize_dimension_runs():
+    sheet = {"properties": {"sheetId": 3, "gridProperties": {"columnCount": 6}}}
+
+    requests = Sheets._resize_dimension(sheet, [100, 100, None, None, 50, 100, 80])
+
+    # runs of equal sizes are merged, and sizes past the grid are dropped
+    assert [
+        (
+            "auto" if "autoResizeDimensions" in request else "size",
+            request.get("updateDimensionProperties", {})
+            .get("properties", {})
+            .get("pixelSize"),
+        )
+        for request in requests
+    ] == [("size", 100), ("auto", None), ("size", 50), ("size", 100)]
+
+    spans = [
+        request.get("autoResizeDimensions", {}).get("dimensions")
+        or request["updateDimensionProperties"]["range"]
+        for request in requests
+    ]
+    assert [(span["startIndex"], span["endIndex"]) for span in spans] == [
+        (0, 2),
+        (2, 4),
+        (4, 5),
+        (5, 6),
+    ]
+    assert all(
+        span["sheetId"] == 3 and span["dimension"] == "COLUMNS" for span in spans
+    )
+
+
+def test_resize_dimension_all():
+    sheet = {"properties": {"sheetId": 0, "gridProperties": {"rowCount": 4}}}
+
+    (request,) = Sheets._resize_dimension(sheet, 30, SheetsDimension.rows)
+    assert request["updateDimensionProperties"]["range"]["endIndex"] == 4
+    assert request["updateDimensionProperties"]["properties"] == {"pixelSize": 30}
+
+    (request,) = Sheets._resize_dimension(sheet, None, SheetsDimension.rows)
+    assert request["autoResizeDimensions"]["dimensions"] == {
+        "sheetId": 0,
+        "dimension": "ROWS",
+        "startIndex": 0,
+        "endIndex": 4,
+    }
+
+
+def test_create_cell_format():
+    cell_format = Sheets._create_cell_format(
+        bold=False,
+        font_size=12,
+        text_color="#f00",
+        padding=2,
+        horizontal_alignment=HorizontalAlignment.CENTER,
+        wrap_strategy=WrapStrategy.WRAP,
+        cell_format={"numberFormat": {"type": "NUMBER"}},
+    )
+
+    # False is a value, only None is omitted
+    assert cell_format == {
+        "textFormat": {
+            "bold": False,
+            "fontSize": 12,
+            "foregroundColor": {"red": 1.0, "green": 0.0, "blue": 0.0},
+        },
+        "padding": {"top": 2, "bottom": 2, "left": 2, "right": 2},
+        "horizontalAlignment": "CENTER",
+        "wrapStrategy": "WRAP",
+        "numberFormat": {"type": "NUMBER"},
+    }
+
+    # no textFormat is emitted without text arguments
+    assert Sheets._create_cell_format(background_color="#000") == {
+        "backgroundColor": {"red": 0.0, "green": 0.0, "blue": 0.0}
+    }
+    assert Sheets._create_cell_format() == {}
+
+
+def test_format_fields():
+    cell_format = {
+        "textFormat": {"bold": True, "foregroundColor": {"red": 1.0}},
+        "wrapStrategy": "WRAP",
+    }
+
+    assert Sheets._format_fields(cell_format) == [
+        "userEnteredFormat.textFormat.bold",
+        "userEnteredFormat.textFormat.foregroundColor.red",
+        "userEnteredFormat.wrapStrategy",
+    ]
+    assert Sheets._format_fields({"bold": True}, prefix="textFormat") == [
+        "textFormat.bold"
+    ]
+
+
+def test_format_merges_extant_runs(
+    sheets: Sheets, api: FakeSheetsAPI, monkeypatch: pytest.MonkeyPatch
+):
+    italic = {"textFormat": {"italic": True}}
+    red = {"backgroundColor": {"red": 1.0}}
+    cell_formats = [[italic, italic, red], [italic, italic, red], [{}, {}, {}]]
+
+    monkeypatch.setattr(
+        sheets,
+        "get_format",
+        lambda spreadsheet_id, range_name: [SheetsFormat(cell_formats=cell_formats)],
+    )
+
+    sheets.format(SPREADSHEET_ID, "Sheet1!B2:D4", bold=True)
+
+    # spans of equal formats are merged, and identical rows extend the rectangles above
+    assert [
+        (
+            repeat_cell["cell"]["userEnteredFormat"],
+            tuple(
+                repeat_cell["range"][k]
+                for k in (
+                    "startRowIndex",
+                    "endRowIndex",
+                    "startColumnIndex",
+                    "endColumnIndex",
+                )
+            ),
+        )
+        for repeat_cell in repeat_cells(api)
+    ] == [
+        ({"textFormat": {"italic": True, "bold": True}}, (1, 3, 1, 3)),
+        ({"backgroundColor": {"red": 1.0}, "textFormat": {"bold": True}}, (1, 3, 3, 4)),
+        ({"textFormat": {"bold": True}}, (3, 4, 1, 4)),
+    ]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import *
+
+import pandas as pd
+
+from googleapiutils2 import Sheets
+
+
+def test_to_frame_blanks_and_dtypes():
+    df = Sheets.to_frame(
+        {"values": [["a", "b", "c"], [1, "x", ""], [2, " ", "y"], [3]]}
+    )
+
+    # blank and whitespace-only strings, and missing trailing cells, are masked
+    assert df.isna().values.tolist() == [
+        [False, False, True],
+        [False, True, False],
+        [False, True, True],
+    ]
+    assert df["a"].dtype == pd.Int64Dtype()
+    assert isinstance(df["b"].dtype, pd.StringDtype)
+    assert isinstance(df["c"].dtype, pd.StringDtype)
+
+    df = Sheets.to_frame({"values": [["a", "b"], [1, "x"]]}, dtypes={"a": "float64"})
+    assert df["a"].dtype == "float64"
+
+
+def test_to_frame_columns():
+    columns = ["z"]
+
+    # the header extends the given columns, which are left as-is
+    df = Sheets.to_frame({"values": [["a", "b"]]}, columns=columns)
+    assert df.empty and df.columns.tolist() == ["z", "a", "b"]
+    assert columns == ["z"]
+
+    assert Sheets.to_frame({}).empty
+
+
+def test_from_frame():
+    df = pd.DataFrame({"a": [1, None], "b": ["x", pd.NA], "c": [1.5, float("nan")]})
+
+    # every value is a string, and missing values are blank
+    assert Sheets.from_frame(df) == [
+        {"a": "1.0", "b": "x", "c": "1.5"},
+        {"a": "", "b": "", "c": ""},
+    ]
+    assert Sheets.from_frame(df, as_dict=False) == [
+        ["a", "b", "c"],
+        ["1.0", "x", "1.5"],
+        ["", "", ""],
+    ]
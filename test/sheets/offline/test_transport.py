@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import threading
+from typing import *
+
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+
+from googleapiutils2 import Sheets
+
+from .fake_sheets import SPREADSHEET_ID
+
+
+def test_get_http_copies_transport(creds: Credentials):
+    sheets = Sheets(creds=creds)
+    request = sheets.spreadsheets.get(spreadsheetId=SPREADSHEET_ID)
+    request.http.http.timeout = 7
+
+    http = sheets._get_http(request)
+
+    assert isinstance(http, AuthorizedHttp) and http is not request.http
+    assert http.credentials is request.http.credentials
+    assert http.http.timeout == 7
+    assert http.http.redirect_codes == request.http.http.redirect_codes
+    assert sheets._get_http(request) is http
+
+    https: list[Any] = []
+    thread = threading.Thread(target=lambda: https.append(sheets._get_http(request)))
+    thread.start()
+    thread.join()
+
+    assert https[0] is not http and https[0].http.timeout == 7
+
+
+def test_get_http_keeps_other_transports(creds: Credentials):
+    sheets = Sheets(creds=creds)
+    request = sheets.spreadsheets.get(spreadsheetId=SPREADSHEET_ID)
+    request.http = object()
+
+    assert sheets._get_http(request) is request.http
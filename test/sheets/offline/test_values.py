@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from typing import *
+
+import pytest
+
+from googleapiutils2 import Sheets
+
+from .fake_sheets import SPREADSHEET_ID, FakeSheetsAPI
+
+
+def test_update_union_of_keys(sheets: Sheets, api: FakeSheetsAPI):
+    sheets.update(SPREADSHEET_ID, "Sheet1", [{"a": 1}, {"b": 2}, {"a": 3, "c": 4}])
+
+    assert api.read("Sheet1")["values"] == [
+        ["a", "b", "c"],
+        [1],
+        ["", 2],
+        [3, "", 4],
+    ]
+
+
+def test_update_keeps_unkeyed_columns(sheets: Sheets, api: FakeSheetsAPI):
+    sheets.update(SPREADSHEET_ID, "Sheet1", [{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+    sheets.update(SPREADSHEET_ID, "Sheet1", [{"a": 5}, {"a": 6}])
+
+    # "b" is in neither row, so its values are kept
+    assert api.read("Sheet1")["values"] == [["a", "b"], [5, 2], [6, 4]]
+
+
+def test_update_scalar_and_flat_row(sheets: Sheets, api: FakeSheetsAPI):
+    sheets.update(SPREADSHEET_ID, "Sheet1!B2", 5)
+    sheets.update(SPREADSHEET_ID, "Sheet1!A3", [1, 2, 3])
+
+    assert api.read("Sheet1!A2:C3")["values"] == [["", 5], [1, 2, 3]]
+
+
+def test_get_append_range(sheets: Sheets, api: FakeSheetsAPI):
+    api.write("Sheet1!A1", [["a", "b", "c"], [1, 2, 3], ["", "", 4]])
+
+    assert str(sheets.get_append_range(SPREADSHEET_ID, "Sheet1")) == "'Sheet1'!A4:A4"
+    append_range = sheets.get_append_range(SPREADSHEET_ID, "Sheet1!A1:B")
+    assert str(append_range) == "'Sheet1'!A3:A3"
+
+
+def test_batch_update_replaced_bytes(sheets: Sheets, api: FakeSheetsAPI):
+    values = [["x" * 10]]
+
+    for _ in range(5):
+        sheets.batch_update(
+            SPREADSHEET_ID,
+            {"Sheet1!A1": values},
+            batch_size=100,
+            batch_size_bytes=1000,
+        )
+
+    assert sheets._batched_bytes[SPREADSHEET_ID] == sheets._get_values_size(values)
+    assert api.count("values.batchUpdate") == 0
+
+    sheets.batched_update_remaining(SPREADSHEET_ID)
+    assert api.count("values.batchUpdate") == 1
+
+
+def test_get_values_size():
+    values = [["abc", 1], ["", None]]
+
+    # within a small margin of the serialized size
+    size = Sheets._get_values_size(values)
+    assert abs(size - len(json.dumps(values))) <= 4
+
+    # dict rows, flat rows, and scalars are estimated as they'd be written
+    assert Sheets._get_values_size([{"a": "abc", "b": 1}]) == Sheets._get_values_size(
+        [["abc", 1]]
+    )
+    assert Sheets._get_values_size(["abc", 1]) == Sheets._get_values_size(
+        [["abc", 1]]
+    )
+    assert Sheets._get_values_size(5) == Sheets._get_values_size([[5]])
+
+
+def test_chunk_value_ranges():
+    value_ranges = [
+        {"range": f"Sheet1!A{n + 1}", "values": [["x" * size]]}
+        for n, size in enumerate([10, 10, 100, 10])
+    ]
+    sizes = [Sheets._get_values_size(t["values"]) for t in value_ranges]
+
+    chunks = list(Sheets._chunk_value_ranges(value_ranges, sizes[0] + sizes[1]))
+
+    # packed greedily, in order; the oversized range is sent alone
+    assert [[t["range"] for t in chunk] for chunk in chunks] == [
+        ["Sheet1!A1", "Sheet1!A2"],
+        ["Sheet1!A3"],
+        ["Sheet1!A4"],
+    ]
+    assert list(Sheets._chunk_value_ranges([], 1)) == []
+
+
+def test_merge_batch_update_values_responses():
+    responses = [
+        {
+            "spreadsheetId": SPREADSHEET_ID,
+            "totalUpdatedRows": 2,
+            "totalUpdatedColumns": 3,
+            "totalUpdatedCells": 6,
+            "responses": [{"updatedRange": "Sheet1!A1:C2"}],
+        },
+        {
+            "spreadsheetId": SPREADSHEET_ID,
+            "totalUpdatedRows": 1,
+            "totalUpdatedColumns": 1,
+            "totalUpdatedCells": 1,
+            "responses": [
+                {"updatedRange": "Sheet1!A3"},
+                {"updatedRange": "'Sheet 2'!A1"},
+            ],
+        },
+    ]
+
+    assert Sheets._merge_batch_update_values_responses(responses[:1]) is responses[0]
+    assert Sheets._merge_batch_update_values_responses(responses) == {
+        "spreadsheetId": SPREADSHEET_ID,
+        "responses": responses[0]["responses"] + responses[1]["responses"],
+        "totalUpdatedRows": 3,
+        "totalUpdatedCells": 7,
+        "totalUpdatedColumns": 3,
+        "totalUpdatedSheets": 2,
+    }
+
+
+def test_flatten_ranges():
+    range_names = ["Sheet1!A3:B3", "Sheet2!A2:B2", "Sheet1!A1:B2", "Sheet1!C4:D4"]
+
+    flat_ranges = Sheets._flatten_ranges(range_names)
+
+    # contiguous ranges merge in row order, keeping their original indexes
+    assert [(ixs, str(sheet_slice)) for ixs, sheet_slice in flat_ranges] == [
+        ([2, 0], "'Sheet1'!A1:B3"),
+        ([3], "'Sheet1'!C4:D4"),
+        ([1], "'Sheet2'!A2:B2"),
+    ]
+
+    # a range whose values don't fill it isn't merged with the next
+    flat_ranges = Sheets._flatten_ranges(range_names, row_counts=[1, 1, 1, 1])
+    assert [ixs for ixs, _ in flat_ranges] == [[2], [0], [3], [1]]
+
+
+def test_flatten_value_ranges():
+    flat_data = Sheets._flatten_value_ranges(
+        ["Sheet1!A2:B2", "Sheet1!A1:B1"], [[[3, 4]], [[1, 2]]]
+    )
+
+    assert {str(k): v for k, v in flat_data.items()} == {
+        "'Sheet1'!A1:B2": [[1, 2], [3, 4]]
+    }
+
+
+def test_batch_update_flat_rows_merge(sheets: Sheets, api: FakeSheetsAPI):
+    # a flat row counts as one row, so it fills its range and merges with the next
+    sheets.batch_update(
+        SPREADSHEET_ID, {"Sheet1!A1:B1": [1, 2], "Sheet1!A2:B2": [[3, 4]]}
+    )
+
+    (data,) = [
+        body["data"] for method, _, body in api.calls if method == "values.batchUpdate"
+    ]
+    assert len(data) == 1
+    assert api.read("Sheet1!A1:B2")["values"] == [[1, 2], [3, 4]]